@@ -63,7 +63,7 @@ def get_integration_docs(name: str) -> str:
                 },
                 indent=2,
             )
-        return json.dumps(docs.to_dict(), indent=2)
+        return docs.to_json()
     except ImportError:
         return json.dumps(
             {
@@ -15,12 +15,19 @@ Usage:
 
     # Platform extracts metadata
     metadata = wren.get_metadata()
+
+Integrations are recorded on init() only in metadata extraction mode
+(enabled by import_script() or WREN_EXTRACT_METADATA=1). Otherwise they
+are recorded on first connection.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import os
+import sys
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 
@@ -33,6 +40,10 @@ class TriggerEntry:
     func: Callable
     config: dict[str, Any]  # type-specific configuration
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the metadata form of this trigger."""
+        return {"type": self.type, "func": self.func_name, "config": self.config}
+
 
 class WrenRegistry:
     """
@@ -43,14 +54,23 @@ class WrenRegistry:
     """
 
     def __init__(self) -> None:
-        self._integrations: list[str] = []
+        # Record integrations at init() time rather than on first connection
+        self.extraction_mode = os.environ.get("WREN_EXTRACT_METADATA") == "1"
+        # Insertion-ordered set of integration names
+        self._integrations: dict[str, None] = {}
         self._triggers: list[TriggerEntry] = []
+        self._triggers_by_type: dict[str, list[TriggerEntry]] = {}
         self._schedules: list[dict[str, str]] = []
+        self._functions: dict[str, Callable] = {}
+        # Snapshot behind get_metadata(), reset whenever anything is registered
+        self._metadata: dict[str, tuple[Any, ...]] | None = None
 
     def register_integration(self, name: str) -> None:
         """Record an integration as being used."""
+        name = sys.intern(name)
         if name not in self._integrations:
-            self._integrations.append(name)
+            self._integrations[name] = None
+            self._metadata = None
 
     def register_trigger(
         self,
@@ -66,55 +86,65 @@ class WrenRegistry:
             config: Type-specific configuration dict
             func: The function to be triggered
         """
+        # Trigger types and names are compared and used as keys repeatedly
+        trigger_type = sys.intern(trigger_type)
         entry = TriggerEntry(
             type=trigger_type,
             func_name=func.__name__,
             func=func,
             config=config,
         )
+        self._metadata = None
         self._triggers.append(entry)
+        self._triggers_by_type.setdefault(trigger_type, []).append(entry)
+        self._functions[entry.func_name] = func
         if trigger_type == "schedule":
             cron = config.get("cron")
             if cron:
-                self._schedules.append({"cron": cron, "func_name": func.__name__})
+                self._schedules.append({"cron": cron, "func_name": entry.func_name})
 
     def get_triggers_by_type(self, trigger_type: str) -> list[TriggerEntry]:
         """Get all triggers of a specific type."""
-        return [t for t in self._triggers if t.type == trigger_type]
+        return list(self._triggers_by_type.get(trigger_type, ()))
 
     def get_metadata(self) -> dict[str, Any]:
         """
         Return all registered metadata.
 
         Used by the platform to extract integration requirements and
-        event triggers after importing a user's script.
+        event triggers after importing a user's script. The snapshot is
+        cached until the next registration; each call returns fresh lists and
+        trigger dicts, so callers may modify the result.
         """
+        metadata = self._metadata
+        if metadata is None:
+            metadata = self._metadata = {
+                "integrations": tuple(self._integrations),
+                "schedules": tuple(self._schedules),
+                "triggers": tuple(t.to_dict() for t in self._triggers),
+            }
         return {
-            "integrations": list(self._integrations),
-            "schedules": list(self._schedules),
-            "triggers": [
-                {
-                    "type": t.type,
-                    "func": t.func_name,
-                    "config": t.config,
-                }
-                for t in self._triggers
-            ],
+            "integrations": list(metadata["integrations"]),
+            "schedules": list(metadata["schedules"]),
+            "triggers": [dict(t) for t in metadata["triggers"]],
         }
 
-    def get_functions(self) -> dict[str, Callable]:
+    def get_functions(self) -> Mapping[str, Callable]:
         """
-        Return a mapping of function names to their callables.
+        Return a read-only mapping of function names to their callables.
 
         Used by the runtime to invoke registered functions by name.
         """
-        return {t.func_name: t.func for t in self._triggers}
+        return MappingProxyType(self._functions)
 
     def clear(self) -> None:
         """Clear all registered metadata. Useful for testing."""
         self._integrations.clear()
         self._triggers.clear()
+        self._triggers_by_type.clear()
         self._schedules.clear()
+        self._functions.clear()
+        self._metadata = None
 
 
 # Global registry instance
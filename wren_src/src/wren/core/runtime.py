@@ -56,9 +56,12 @@ def import_script(
         sys.path.insert(0, script_dir)
         added_path = True
 
+    previous_mode = registry.extraction_mode
+    registry.extraction_mode = True
     try:
         spec.loader.exec_module(module)
     finally:
+        registry.extraction_mode = previous_mode
         if added_path:
             sys.path.remove(script_dir)
 
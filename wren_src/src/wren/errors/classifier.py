@@ -55,6 +55,14 @@ class ClassifiedError:
         return d
 
 
+def _exc_message(exc: BaseException) -> str:
+    """Return ``str(exc)``, reading ``args[0]`` directly when that is equivalent."""
+    args = exc.args
+    if len(args) == 1 and isinstance(args[0], str) and type(exc).__str__ is BaseException.__str__:
+        return args[0]
+    return str(exc)
+
+
 def extract_name_from_nameerror(msg: str) -> str | None:
     """Extract the undefined name from a NameError message."""
     # "name 'foo' is not defined"
@@ -75,8 +83,8 @@ def extract_module_from_importerror(msg: str) -> str | None:
     return None
 
 
-def extract_location_from_tb(exc: Exception) -> ErrorLocation | None:
-    """Extract error location from exception traceback."""
+def _location_dict_from_tb(exc: BaseException) -> dict | None:
+    """Return the traceback location of an exception in ``ErrorLocation.to_dict`` form."""
     tb = exc.__traceback__
     if tb is None:
         return None
@@ -85,52 +93,91 @@ def extract_location_from_tb(exc: Exception) -> ErrorLocation | None:
     while tb.tb_next is not None:
         tb = tb.tb_next
 
-    return ErrorLocation(
-        file=tb.tb_frame.f_code.co_filename,
-        line=tb.tb_lineno,
+    return {"file": tb.tb_frame.f_code.co_filename, "line": tb.tb_lineno}
+
+
+def extract_location_from_tb(exc: Exception) -> ErrorLocation | None:
+    """Extract error location from exception traceback."""
+    location = _location_dict_from_tb(exc)
+    return ErrorLocation(**location) if location else None
+
+
+def _error_dict(
+    error_type: ErrorType,
+    error_code: str,
+    message: str,
+    fix_hint: str | None = None,
+    location: dict | None = None,
+    original_error: str | None = None,
+) -> dict[str, Any]:
+    """Build the same dict as ``ClassifiedError.to_dict`` without the dataclass."""
+    d: dict[str, Any] = {
+        "error_type": error_type,
+        "error_code": error_code,
+        "message": message,
+    }
+    if fix_hint:
+        d["fix_hint"] = fix_hint
+    if location:
+        d["location"] = location
+    if original_error:
+        d["original_error"] = original_error
+    return d
+
+
+def _from_dict(d: dict[str, Any]) -> ClassifiedError:
+    """Rebuild a ClassifiedError from the output of a ``_make_dict_*`` builder."""
+    location = d.get("location")
+    return ClassifiedError(
+        error_type=d["error_type"],
+        error_code=d["error_code"],
+        message=d["message"],
+        fix_hint=d.get("fix_hint"),
+        location=ErrorLocation(**location) if location else None,
+        original_error=d.get("original_error"),
     )
 
 
-def classify_syntax_error(exc: SyntaxError) -> ClassifiedError:
-    """Classify a SyntaxError."""
+def _make_dict_syntax_error(exc: SyntaxError) -> dict[str, Any]:
     location = None
     if exc.filename and exc.lineno:
-        location = ErrorLocation(
-            file=exc.filename,
-            line=exc.lineno,
-            col=exc.offset,
-        )
+        location = {"file": exc.filename, "line": exc.lineno}
+        if exc.offset is not None:
+            location["col"] = exc.offset
 
     # Provide specific hints for common syntax errors
-    msg = str(exc.msg) if exc.msg else str(exc)
+    msg = exc.msg
+    if not msg:
+        msg = _exc_message(exc)
+    elif not isinstance(msg, str):
+        msg = str(msg)
     fix_hint = "Fix the syntax error in the code."
 
-    if "invalid syntax" in msg.lower():
+    lowered = msg.lower()
+    if "invalid syntax" in lowered:
         fix_hint = "Check for missing colons, brackets, or incorrect indentation."
-    elif "unexpected indent" in msg.lower():
+    elif "unexpected indent" in lowered:
         fix_hint = "Remove extra indentation or align with the previous line."
-    elif "expected an indented block" in msg.lower():
+    elif "expected an indented block" in lowered:
         fix_hint = "Add an indented block after the colon (e.g., 'pass' or actual code)."
-    elif "unterminated string" in msg.lower():
+    elif "unterminated string" in lowered:
         fix_hint = "Close the string with a matching quote."
-    elif "unmatched" in msg.lower():
+    elif "unmatched" in lowered:
         fix_hint = "Check for matching parentheses, brackets, or braces."
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="SYNTAX_ERROR",
-        message=msg,
-        fix_hint=fix_hint,
-        location=location,
-        original_error=f"SyntaxError: {msg}",
+    return _error_dict(
+        "AgentFixableError",
+        "SYNTAX_ERROR",
+        msg,
+        fix_hint,
+        location,
+        f"SyntaxError: {msg}",
     )
 
 
-def classify_name_error(exc: NameError) -> ClassifiedError:
-    """Classify a NameError."""
-    msg = str(exc)
+def _make_dict_name_error(exc: NameError) -> dict[str, Any]:
+    msg = _exc_message(exc)
     name = extract_name_from_nameerror(msg)
-    location = extract_location_from_tb(exc)
 
     fix_hint = "Check spelling or add the missing import."
     if name:
@@ -142,21 +189,19 @@ def classify_name_error(exc: NameError) -> ClassifiedError:
         else:
             fix_hint = f"'{name}' is not defined. Check spelling or add the missing import."
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="NAME_ERROR",
-        message=msg,
-        fix_hint=fix_hint,
-        location=location,
-        original_error=f"NameError: {msg}",
+    return _error_dict(
+        "AgentFixableError",
+        "NAME_ERROR",
+        msg,
+        fix_hint,
+        _location_dict_from_tb(exc),
+        f"NameError: {msg}",
     )
 
 
-def classify_import_error(exc: ImportError | ModuleNotFoundError) -> ClassifiedError:
-    """Classify an ImportError or ModuleNotFoundError."""
-    msg = str(exc)
+def _make_dict_import_error(exc: ImportError | ModuleNotFoundError) -> dict[str, Any]:
+    msg = _exc_message(exc)
     module = extract_module_from_importerror(msg)
-    location = extract_location_from_tb(exc)
 
     fix_hint = "Check the module name or install the missing package."
     if module:
@@ -165,20 +210,18 @@ def classify_import_error(exc: ImportError | ModuleNotFoundError) -> ClassifiedE
         else:
             fix_hint = f"Install missing package: pip install {module.split('.')[0]}"
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="IMPORT_ERROR",
-        message=msg,
-        fix_hint=fix_hint,
-        location=location,
-        original_error=f"{type(exc).__name__}: {msg}",
+    return _error_dict(
+        "AgentFixableError",
+        "IMPORT_ERROR",
+        msg,
+        fix_hint,
+        _location_dict_from_tb(exc),
+        f"{type(exc).__name__}: {msg}",
     )
 
 
-def classify_type_error(exc: TypeError) -> ClassifiedError:
-    """Classify a TypeError."""
-    msg = str(exc)
-    location = extract_location_from_tb(exc)
+def _make_dict_type_error(exc: TypeError) -> dict[str, Any]:
+    msg = _exc_message(exc)
 
     fix_hint = "Check the types of arguments being passed."
 
@@ -192,20 +235,18 @@ def classify_type_error(exc: TypeError) -> ClassifiedError:
     elif "not callable" in msg:
         fix_hint = "Check that you're calling a function, not a value."
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="TYPE_ERROR",
-        message=msg,
-        fix_hint=fix_hint,
-        location=location,
-        original_error=f"TypeError: {msg}",
+    return _error_dict(
+        "AgentFixableError",
+        "TYPE_ERROR",
+        msg,
+        fix_hint,
+        _location_dict_from_tb(exc),
+        f"TypeError: {msg}",
     )
 
 
-def classify_attribute_error(exc: AttributeError) -> ClassifiedError:
-    """Classify an AttributeError."""
-    msg = str(exc)
-    location = extract_location_from_tb(exc)
+def _make_dict_attribute_error(exc: AttributeError) -> dict[str, Any]:
+    msg = _exc_message(exc)
 
     fix_hint = "Check the attribute name or ensure the object is correctly initialized."
 
@@ -215,20 +256,18 @@ def classify_attribute_error(exc: AttributeError) -> ClassifiedError:
         obj_type, attr = match.groups()
         fix_hint = f"'{obj_type}' has no attribute '{attr}'. Check spelling or API documentation."
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="ATTRIBUTE_ERROR",
-        message=msg,
-        fix_hint=fix_hint,
-        location=location,
-        original_error=f"AttributeError: {msg}",
+    return _error_dict(
+        "AgentFixableError",
+        "ATTRIBUTE_ERROR",
+        msg,
+        fix_hint,
+        _location_dict_from_tb(exc),
+        f"AttributeError: {msg}",
     )
 
 
-def classify_value_error(exc: ValueError) -> ClassifiedError:
-    """Classify a ValueError."""
-    msg = str(exc)
-    location = extract_location_from_tb(exc)
+def _make_dict_value_error(exc: ValueError) -> dict[str, Any]:
+    msg = _exc_message(exc)
 
     fix_hint = "Check the value being passed."
 
@@ -236,65 +275,55 @@ def classify_value_error(exc: ValueError) -> ClassifiedError:
     if "cron" in msg.lower():
         fix_hint = "Fix the cron expression. Format: 'minute hour day month weekday' (e.g., '0 9 * * 1-5')."
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="VALUE_ERROR",
-        message=msg,
-        fix_hint=fix_hint,
-        location=location,
-        original_error=f"ValueError: {msg}",
+    return _error_dict(
+        "AgentFixableError",
+        "VALUE_ERROR",
+        msg,
+        fix_hint,
+        _location_dict_from_tb(exc),
+        f"ValueError: {msg}",
     )
 
 
-def classify_file_not_found(exc: FileNotFoundError) -> ClassifiedError:
-    """Classify a FileNotFoundError."""
-    msg = str(exc)
+def _make_dict_file_not_found(exc: FileNotFoundError) -> dict[str, Any]:
+    msg = _exc_message(exc)
 
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="FILE_NOT_FOUND",
-        message=msg,
-        fix_hint="Check the file path. Use absolute paths or paths relative to the script location.",
+    return _error_dict(
+        "AgentFixableError",
+        "FILE_NOT_FOUND",
+        msg,
+        "Check the file path. Use absolute paths or paths relative to the script location.",
         original_error=f"FileNotFoundError: {msg}",
     )
 
 
-def classify_exception(exc: Exception) -> ClassifiedError:
-    """
-    Classify any exception into an actionable error for agents.
-
-    Returns a ClassifiedError with:
-    - error_type: AgentFixableError, UserFacingConfigError, or InternalError
-    - error_code: A machine-readable error code
-    - message: Human-readable error message
-    - fix_hint: Actionable suggestion for fixing the error
-    - location: File/line/col where error occurred (if available)
-    """
+def _make_dict_exception(exc: Exception) -> dict[str, Any]:
     if isinstance(exc, SyntaxError):
-        return classify_syntax_error(exc)
+        return _make_dict_syntax_error(exc)
 
     if isinstance(exc, NameError):
-        return classify_name_error(exc)
+        return _make_dict_name_error(exc)
 
     if isinstance(exc, (ImportError, ModuleNotFoundError)):
-        return classify_import_error(exc)
+        return _make_dict_import_error(exc)
 
     if isinstance(exc, TypeError):
-        return classify_type_error(exc)
+        return _make_dict_type_error(exc)
 
     if isinstance(exc, AttributeError):
-        return classify_attribute_error(exc)
+        return _make_dict_attribute_error(exc)
 
     if isinstance(exc, ValueError):
-        return classify_value_error(exc)
+        return _make_dict_value_error(exc)
 
     if isinstance(exc, FileNotFoundError):
-        return classify_file_not_found(exc)
+        return _make_dict_file_not_found(exc)
 
     # Check for common credential/config errors that need user action
-    msg = str(exc).lower()
+    msg = _exc_message(exc)
+    lowered = msg.lower()
     if any(
-        kw in msg
+        kw in lowered
         for kw in [
             "api key",
             "credentials",
@@ -305,31 +334,79 @@ def classify_exception(exc: Exception) -> ClassifiedError:
             "401",
         ]
     ):
-        return ClassifiedError(
-            error_type="UserFacingConfigError",
-            error_code="AUTH_ERROR",
-            message=str(exc),
-            fix_hint="Configure credentials via the platform UI or environment variables.",
-            original_error=f"{type(exc).__name__}: {exc}",
+        return _error_dict(
+            "UserFacingConfigError",
+            "AUTH_ERROR",
+            msg,
+            "Configure credentials via the platform UI or environment variables.",
+            original_error=f"{type(exc).__name__}: {msg}",
         )
 
     # Default: treat as agent-fixable with generic message
-    location = extract_location_from_tb(exc)
-    return ClassifiedError(
-        error_type="AgentFixableError",
-        error_code="RUNTIME_ERROR",
-        message=str(exc),
-        fix_hint="Check the error message and fix the underlying issue.",
-        location=location,
-        original_error=f"{type(exc).__name__}: {exc}",
+    return _error_dict(
+        "AgentFixableError",
+        "RUNTIME_ERROR",
+        msg,
+        "Check the error message and fix the underlying issue.",
+        _location_dict_from_tb(exc),
+        f"{type(exc).__name__}: {msg}",
     )
 
 
+def classify_syntax_error(exc: SyntaxError) -> ClassifiedError:
+    """Classify a SyntaxError."""
+    return _from_dict(_make_dict_syntax_error(exc))
+
+
+def classify_name_error(exc: NameError) -> ClassifiedError:
+    """Classify a NameError."""
+    return _from_dict(_make_dict_name_error(exc))
+
+
+def classify_import_error(exc: ImportError | ModuleNotFoundError) -> ClassifiedError:
+    """Classify an ImportError or ModuleNotFoundError."""
+    return _from_dict(_make_dict_import_error(exc))
+
+
+def classify_type_error(exc: TypeError) -> ClassifiedError:
+    """Classify a TypeError."""
+    return _from_dict(_make_dict_type_error(exc))
+
+
+def classify_attribute_error(exc: AttributeError) -> ClassifiedError:
+    """Classify an AttributeError."""
+    return _from_dict(_make_dict_attribute_error(exc))
+
+
+def classify_value_error(exc: ValueError) -> ClassifiedError:
+    """Classify a ValueError."""
+    return _from_dict(_make_dict_value_error(exc))
+
+
+def classify_file_not_found(exc: FileNotFoundError) -> ClassifiedError:
+    """Classify a FileNotFoundError."""
+    return _from_dict(_make_dict_file_not_found(exc))
+
+
+def classify_exception(exc: Exception) -> ClassifiedError:
+    """
+    Classify any exception into an actionable error for agents.
+
+    Returns a ClassifiedError with:
+    - error_type: AgentFixableError, UserFacingConfigError, or InternalError
+    - error_code: A machine-readable error code
+    - message: Human-readable error message
+    - fix_hint: Actionable suggestion for fixing the error
+    - location: File/line/col where error occurred (if available)
+    """
+    return _from_dict(_make_dict_exception(exc))
+
+
 def format_error_for_agent(exc: Exception) -> dict:
     """
     Format an exception as a dict suitable for agent consumption.
 
-    This is the main entry point for the CLI to use.
+    This is the main entry point for the CLI to use. Builds the dict
+    directly rather than going through ClassifiedError.to_dict().
     """
-    classified = classify_exception(exc)
-    return classified.to_dict()
+    return _make_dict_exception(exc)
@@ -20,6 +20,8 @@ Usage:
 
 from __future__ import annotations
 
+import importlib
+import sys
 from typing import Any
 
 from ..core.registry import registry
@@ -29,23 +31,56 @@ from .docs import AuthType, IntegrationDocs, render_all_docs
 # Registry of available integrations
 _INTEGRATION_REGISTRY: dict[str, type[BaseIntegration]] = {}
 
-# Registry of integration documentation
-_DOCS_REGISTRY: dict[str, IntegrationDocs] = {}
+# Built-in integration modules, imported on first use (importing registers them)
+_BUILTIN_INTEGRATIONS: dict[str, str] = {
+    "cron": ".cron",
+    "discord": ".discord",
+    "gmail": ".gmail",
+    "messaging": ".messaging",
+    "slack": ".slack",
+}
+
+# Sorted integration names, rebuilt after registration
+_names_sorted: list[str] | None = None
+
+# Markdown for every registered integration, rendered on first use
+_all_docs_markdown: str | None = None
+
+# Markdown for specific lists of integration names, keyed by the names in order
+_rendered_docs: dict[tuple[str, ...], str] = {}
+
+# UTF-8 encoded renders, keyed like _rendered_docs (None = all integrations)
+_encoded_docs: dict[tuple[str, ...] | None, bytes] = {}
 
 
 def register_integration(name: str):
-    """Decorator to register an integration class and its documentation."""
+    """Decorator to register an integration class and its documentation.
+
+    DOCS is read from the class on demand, so integrations using LazyDocs
+    only build their documentation when it is first requested.
+    """
 
     def decorator(cls: type[BaseIntegration]) -> type[BaseIntegration]:
-        _INTEGRATION_REGISTRY[name] = cls
-        # Also register DOCS if the class has them
-        if hasattr(cls, "DOCS") and cls.DOCS is not None:
-            _DOCS_REGISTRY[name] = cls.DOCS
+        global _all_docs_markdown, _names_sorted
+        _INTEGRATION_REGISTRY[sys.intern(name)] = cls
+        _names_sorted = None
+        _all_docs_markdown = None
+        _rendered_docs.clear()
+        _encoded_docs.clear()
         return cls
 
     return decorator
 
 
+def _load_integration(name: str) -> type[BaseIntegration] | None:
+    """Return the class registered for name, importing its built-in module if needed."""
+    cls = _INTEGRATION_REGISTRY.get(name)
+    if cls is None and name in _BUILTIN_INTEGRATIONS:
+        importlib.import_module(_BUILTIN_INTEGRATIONS[name], __name__)
+        cls = _INTEGRATION_REGISTRY.get(name)
+    return cls
+
+
 def list_integrations() -> list[str]:
     """
     List all registered integration names.
@@ -53,7 +88,10 @@ def list_integrations() -> list[str]:
     Returns:
         List of integration names (e.g., ["gmail", "slack", "cron", ...])
     """
-    return sorted(_INTEGRATION_REGISTRY.keys())
+    global _names_sorted
+    if _names_sorted is None:
+        _names_sorted = sorted(_BUILTIN_INTEGRATIONS.keys() | _INTEGRATION_REGISTRY.keys())
+    return list(_names_sorted)
 
 
 def get_integration_docs(name: str) -> IntegrationDocs | None:
@@ -66,13 +104,33 @@ def get_integration_docs(name: str) -> IntegrationDocs | None:
     Returns:
         IntegrationDocs if available, None otherwise
     """
-    return _DOCS_REGISTRY.get(name)
+    cls = _load_integration(name)
+    return cls.DOCS if cls is not None else None
+
+
+def get_all_docs_markdown() -> str:
+    """
+    Render documentation for all integrations as markdown.
+
+    DOCS never change after import, so the result is built once and reused
+    until another integration is registered.
+
+    Returns:
+        Markdown string with all integration documentation
+    """
+    global _all_docs_markdown
+    if _all_docs_markdown is None:
+        docs = [get_integration_docs(name) for name in list_integrations()]
+        _all_docs_markdown = render_all_docs([d for d in docs if d is not None])
+    return _all_docs_markdown
 
 
 def render_integration_docs(names: list[str] | None = None) -> str:
     """
     Render integration documentation as markdown.
 
+    Results are cached per list of names until another integration is registered.
+
     Args:
         names: Optional list of integration names to include.
                If None, includes all integrations with docs.
@@ -81,11 +139,35 @@ def render_integration_docs(names: list[str] | None = None) -> str:
         Markdown string with integration documentation
     """
     if names is None:
-        docs = list(_DOCS_REGISTRY.values())
-    else:
-        docs = [_DOCS_REGISTRY[n] for n in names if n in _DOCS_REGISTRY]
+        return get_all_docs_markdown()
+
+    key = tuple(names)
+    rendered = _rendered_docs.get(key)
+    if rendered is None:
+        docs = [get_integration_docs(n) for n in key]
+        rendered = _rendered_docs[key] = render_all_docs([d for d in docs if d is not None])
+    return rendered
+
+
+def render_integration_docs_bytes(names: list[str] | None = None) -> bytes:
+    """
+    Render integration documentation as UTF-8 encoded markdown.
+
+    For callers that write the docs out as bytes (e.g. HTTP responses); the
+    encoding is done once per list of names and cached like the text render.
 
-    return render_all_docs(docs)
+    Args:
+        names: Optional list of integration names to include.
+               If None, includes all integrations with docs.
+
+    Returns:
+        UTF-8 bytes of render_integration_docs(names)
+    """
+    key = None if names is None else tuple(names)
+    encoded = _encoded_docs.get(key)
+    if encoded is None:
+        encoded = _encoded_docs[key] = render_integration_docs(names).encode()
+    return encoded
 
 
 class IntegrationInitializer:
@@ -103,7 +185,8 @@ class IntegrationInitializer:
         """
         Initialize the integration.
 
-        1. Records integration name to registry (for metadata extraction)
+        1. Records integration name to registry when extracting metadata
+           (otherwise it is recorded on first connection)
         2. Returns a lazy client that connects on first method call
 
         Args:
@@ -113,16 +196,16 @@ class IntegrationInitializer:
             Integration client instance
         """
         # Record to registry for metadata extraction
-        registry.register_integration(self._name)
+        if registry.extraction_mode:
+            registry.register_integration(self._name)
 
         # Get the integration class
-        if self._name not in _INTEGRATION_REGISTRY:
+        integration_cls = _load_integration(self._name)
+        if integration_cls is None:
             raise ValueError(
-                f"Unknown integration: {self._name!r}. "
-                f"Available: {list(_INTEGRATION_REGISTRY.keys())}"
+                f"Unknown integration: {self._name!r}. Available: {list_integrations()}"
             )
 
-        integration_cls = _INTEGRATION_REGISTRY[self._name]
         return integration_cls(self._name, config)
 
     def __getattr__(self, name: str) -> Any:
@@ -170,15 +253,6 @@ class IntegrationManager:
 # Global integration manager instance
 integrations = IntegrationManager()
 
-# Import integrations to register them (side effect: registers them)
-from . import (  # noqa: E402, F401
-    cron,
-    discord,
-    gmail,
-    messaging,
-    slack,
-)
-
 __all__ = [
     "integrations",
     "BaseIntegration",
@@ -187,5 +261,7 @@ __all__ = [
     "register_integration",
     "list_integrations",
     "get_integration_docs",
+    "get_all_docs_markdown",
     "render_integration_docs",
+    "render_integration_docs_bytes",
 ]
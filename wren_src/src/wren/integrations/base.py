@@ -13,6 +13,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from ..core.registry import registry
+
 if TYPE_CHECKING:
     from .docs import IntegrationDocs
 
@@ -62,8 +64,9 @@ class BaseIntegration(ABC):
         pass
 
     def _ensure_connected(self) -> None:
-        """Connect if not already connected."""
+        """Record the integration and connect if not already connected."""
         if not self._connected:
+            registry.register_integration(self._name)
             self._connect()
             self._connected = True
 
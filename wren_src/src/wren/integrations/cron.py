@@ -121,5 +121,4 @@ def create_schedule(hour: int):
 
     def get_schedules(self) -> list[dict[str, Any]]:
         """Return all registered schedules (for debugging/testing)."""
-        triggers = registry.get_metadata()["triggers"]
-        return [t for t in triggers if t["type"] == "schedule"]
+        return [t.to_dict() for t in registry.get_triggers_by_type("schedule")]
@@ -8,7 +8,12 @@ messages, reading channel history, creating channels, and adding reactions.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import os
+import random
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, ClassVar
@@ -19,27 +24,84 @@ from .docs import AuthType, IntegrationDocs, MethodDoc, ParamDoc
 
 # Defer import to allow SDK to work without discord.py installed
 discord_module: Any = None
+_DISCORD_LOCK = threading.Lock()
 
 
 def _get_discord():
-    """Lazy import discord.py."""
+    """Lazy import discord.py (thread-safe; lock-free once imported)."""
     global discord_module
     if discord_module is None:
-        try:
-            import discord
-
-            discord_module = discord
-        except ImportError as e:
-            raise ImportError(
-                "discord.py is required for the Discord integration. "
-                "Install it with: pip install discord.py"
-            ) from e
+        with _DISCORD_LOCK:
+            if discord_module is None:
+                try:
+                    import discord
+                except ImportError as e:
+                    raise ImportError(
+                        "discord.py is required for the Discord integration. "
+                        "Install it with: pip install discord.py"
+                    ) from e
+                discord_module = discord
     return discord_module
 
 
-@dataclass
+# Shared event loop running in a daemon thread; all discord.py calls run on it
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_THREAD: threading.Thread | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use."""
+    global _LOOP, _LOOP_THREAD
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="wren-discord-loop", daemon=True
+                )
+                thread.start()
+                _LOOP_THREAD = thread
+                _LOOP = loop
+    return _LOOP
+
+
+def _run_async(coro):
+    """Run a coroutine on the background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+# Retry policy for rate limits discord.py gives up on (Retry-After above its timeout);
+# it already retries 429s and 5xx itself, so server errors are not retried here
+_MAX_ATTEMPTS = 6
+_MAX_JITTER = 0.5
+
+
+# Fetched channel/guild objects are reused for this long, up to this many each
+_CACHE_TTL = 300.0
+_CACHE_MAX_SIZE = 256
+
+
+def _to_int(value: int | str) -> int:
+    """Return a Discord snowflake as int, parsing only when given a string."""
+    return value if isinstance(value, int) else int(value)
+
+
+class _RawEmbed:
+    """Embed stand-in whose to_dict() returns the caller's dict unchanged."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def to_dict(self) -> dict[str, Any]:
+        return self._data
+
+
+@dataclass(slots=True)
 class DiscordMessage:
-    """Represents a Discord message."""
+    """Represents a Discord message (slotted; get_messages builds many at once)."""
 
     id: str
     channel_id: str
@@ -54,88 +116,238 @@ class DiscordClient:
     Synchronous wrapper around discord.py's HTTP-only API.
 
     Uses login() instead of start() — no gateway/websocket connection needed
-    since all operations are REST-based.
+    since all operations are REST-based. The logged-in client (and its HTTP
+    session) is created on first use and reused until close(). Coroutines run
+    on a shared background event loop, so calls are safe from any thread.
     """
 
     def __init__(self, token: str) -> None:
         self._token = token
         self._discord = _get_discord()
-
-    def _run_async(self, coro):
-        """Run an async coroutine synchronously."""
-        return asyncio.run(coro)
-
-    async def _run_with_client(self, callback):
+        self._client: Any = None
+        self._lock = threading.Lock()
+        # id -> (object, fetched_at); only touched from the background loop
+        self._channels: OrderedDict[int, tuple[Any, float]] = OrderedDict()
+        self._guilds: OrderedDict[int, tuple[Any, float]] = OrderedDict()
+        # id -> in-flight fetch, one map per cache so channel/guild ids never collide
+        self._pending_channels: dict[int, asyncio.Future] = {}
+        self._pending_guilds: dict[int, asyncio.Future] = {}
+
+    async def _login(self):
+        """Create a discord.py client on the running loop and log in via REST."""
+        discord = self._discord
+        client = discord.Client(intents=discord.Intents.default())
+        try:
+            await client.login(self._token)
+        except BaseException:
+            await client.close()
+            raise
+        return client
+
+    def _ensure_client(self):
+        """Log in once; the client's HTTP session is bound to the background loop."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = _run_async(self._login())
+                    atexit.register(self.close)
+        return self._client
+
+    async def _with_retry(self, coro_factory, max_attempts: int = _MAX_ATTEMPTS):
         """
-        Create a discord.py client, log in via REST (no gateway), run
-        callback, then cleanly close the HTTP session.
+        Await coro_factory(), retrying when discord.py raises RateLimited.
+
+        A rate-limited request was never processed, so retrying is safe even for
+        POSTs. Waits retry_after plus random jitter between attempts; any other
+        error, and the final failure, propagate.
         """
         discord = self._discord
-        intents = discord.Intents.default()
-        client = discord.Client(intents=intents)
+        for _ in range(max_attempts - 1):
+            try:
+                return await coro_factory()
+            except discord.RateLimited as e:
+                delay = e.retry_after
+            await asyncio.sleep(delay + random.uniform(0, _MAX_JITTER))
+        return await coro_factory()
+
+    async def _cached_fetch(self, cache, pending_map, key: int, fetch):
+        """
+        Return cache[key] if fresh, otherwise await fetch(key) and store it (LRU).
+
+        Concurrent misses for the same key share the in-flight fetch kept in
+        pending_map, which must belong to this cache alone.
+        """
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < _CACHE_TTL:
+            cache.move_to_end(key)
+            return entry[0]
+
+        pending = pending_map.get(key)
+        if pending is not None:
+            return await pending
+
+        pending = asyncio.ensure_future(self._with_retry(lambda: fetch(key)))
+        pending_map[key] = pending
         try:
-            await client.login(self._token)
-            return await callback(client)
+            obj = await pending
         finally:
-            await client.close()
+            del pending_map[key]
+        cache[key] = (obj, time.monotonic())
+        if len(cache) > _CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+        return obj
+
+    async def _fetch_channel(self, client, channel_id: int | str):
+        """Fetch a channel, reusing a recently fetched object for the same id."""
+        return await self._cached_fetch(
+            self._channels, self._pending_channels, _to_int(channel_id), client.fetch_channel
+        )
+
+    async def _fetch_guild(self, client, guild_id: int | str):
+        """Fetch a guild, reusing a recently fetched object for the same id."""
+        return await self._cached_fetch(
+            self._guilds, self._pending_guilds, _to_int(guild_id), client.fetch_guild
+        )
+
+    def _run_with_client(self, callback):
+        """Run callback(client) on the background loop and return its result."""
+        client = self._ensure_client()
+        return _run_async(callback(client))
+
+    def close(self) -> None:
+        """Close the HTTP session, if open."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is None:
+            return
+        self._channels.clear()
+        self._guilds.clear()
+        atexit.unregister(self.close)
+        _run_async(client.close())
+
+    def _raw_embed_params(self, client, content: str, embed: dict[str, Any]):
+        """
+        Build send_message parameters carrying the embed dict as-is.
+
+        Returns None when discord.py's internals differ from what we expect,
+        so the caller can fall back to the public API.
+        """
+        try:
+            return self._discord.http.handle_message_parameters(
+                content=content,
+                embed=_RawEmbed(embed),
+                previous_allowed_mentions=client.allowed_mentions,
+            )
+        except (AttributeError, TypeError):
+            return None
+
+    async def _send_raw_embed(self, client, channel_id: int | str, params):
+        """Post prepared parameters via discord.py's HTTP adapter, skipping Embed parsing."""
+        with params:
+            data = await self._with_retry(
+                lambda: client.http.send_message(_to_int(channel_id), params=params)
+            )
+        return {
+            "id": data["id"],
+            "channel_id": data["channel_id"],
+            "content": data["content"],
+            "timestamp": self._discord.utils.snowflake_time(int(data["id"])).isoformat(),
+        }
+
+    async def _send(
+        self, client, channel_id: int | str, content: str, embed: dict[str, Any] | None
+    ):
+        """Send one message and return its summary dict."""
+        if embed:
+            params = self._raw_embed_params(client, content, embed)
+            if params is not None:
+                # Errors from the POST itself propagate; falling back could send twice
+                return await self._send_raw_embed(client, channel_id, params)
+        channel = await self._fetch_channel(client, channel_id)
+        embed_obj = self._discord.Embed.from_dict(embed) if embed else None
+        message = await self._with_retry(lambda: channel.send(content=content, embed=embed_obj))
+        return {
+            "id": str(message.id),
+            "channel_id": str(message.channel.id),
+            "content": message.content,
+            "timestamp": message.created_at.isoformat(),
+        }
 
     def send_message(
         self,
-        channel_id: str,
+        channel_id: int | str,
         content: str,
         embed: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Send a message to a channel."""
-        discord = self._discord
 
         async def _do(client):
-            channel = await client.fetch_channel(int(channel_id))
-            embed_obj = discord.Embed.from_dict(embed) if embed else None
-            message = await channel.send(content=content, embed=embed_obj)
-            return {
-                "id": str(message.id),
-                "channel_id": str(message.channel.id),
-                "content": message.content,
-                "timestamp": message.created_at.isoformat(),
-            }
+            return await self._send(client, channel_id, content, embed)
 
-        return self._run_async(self._run_with_client(_do))
+        return self._run_with_client(_do)
 
-    def get_messages(self, channel_id: str, limit: int = 50) -> list[DiscordMessage]:
+    def send_messages(
+        self,
+        items: list[tuple[int | str, str, dict[str, Any] | None]],
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Send several messages concurrently.
+
+        Args:
+            items: (channel_id, content, embed) tuples
+
+        Returns:
+            One entry per item, in input order: the message dict, or the
+            exception raised for that item if it failed.
+        """
+
+        async def _do(client):
+            return await asyncio.gather(
+                *(self._send(client, cid, content, embed) for cid, content, embed in items),
+                return_exceptions=True,
+            )
+
+        return self._run_with_client(_do)
+
+    def get_messages(self, channel_id: int | str, limit: int = 50) -> list[DiscordMessage]:
         """Get recent messages from a channel."""
 
         async def _do(client):
-            channel = await client.fetch_channel(int(channel_id))
-            messages = []
-            async for msg in channel.history(limit=limit):
-                messages.append(
+            channel = await self._fetch_channel(client, channel_id)
+            # Every message in the history belongs to this channel
+            chan_id = str(channel.id)
+
+            async def _history():
+                return [
                     DiscordMessage(
                         id=str(msg.id),
-                        channel_id=str(msg.channel.id),
+                        channel_id=chan_id,
                         content=msg.content,
                         author=str(msg.author),
                         timestamp=msg.created_at,
-                        embeds=[e.to_dict() for e in msg.embeds],
+                        embeds=[e.to_dict() for e in msg.embeds] if msg.embeds else [],
                     )
-                )
-            return messages
+                    async for msg in channel.history(limit=limit)
+                ]
 
-        return self._run_async(self._run_with_client(_do))
+            return await self._with_retry(_history)
+
+        return self._run_with_client(_do)
 
     def create_channel(
         self,
         name: str,
-        guild_id: str,
+        guild_id: int | str,
         channel_type: str = "text",
     ) -> dict[str, Any]:
         """Create a new channel in a guild."""
 
         async def _do(client):
-            guild = await client.fetch_guild(int(guild_id))
+            guild = await self._fetch_guild(client, guild_id)
             if channel_type == "voice":
-                channel = await guild.create_voice_channel(name=name)
+                channel = await self._with_retry(lambda: guild.create_voice_channel(name=name))
             else:
-                channel = await guild.create_text_channel(name=name)
+                channel = await self._with_retry(lambda: guild.create_text_channel(name=name))
             return {
                 "id": str(channel.id),
                 "name": channel.name,
@@ -143,17 +355,17 @@ class DiscordClient:
                 "guild_id": str(guild.id),
             }
 
-        return self._run_async(self._run_with_client(_do))
+        return self._run_with_client(_do)
 
-    def add_reaction(self, channel_id: str, message_id: str, emoji: str) -> None:
+    def add_reaction(self, channel_id: int | str, message_id: int | str, emoji: str) -> None:
         """Add a reaction to a message."""
 
         async def _do(client):
-            channel = await client.fetch_channel(int(channel_id))
-            message = await channel.fetch_message(int(message_id))
-            await message.add_reaction(emoji)
+            channel = await self._fetch_channel(client, channel_id)
+            message = await self._with_retry(lambda: channel.fetch_message(_to_int(message_id)))
+            await self._with_retry(lambda: message.add_reaction(emoji))
 
-        self._run_async(self._run_with_client(_do))
+        self._run_with_client(_do)
 
 
 @register_integration("discord")
@@ -165,6 +377,9 @@ class DiscordIntegration(BaseIntegration):
     creating channels, and adding reactions to Discord servers.
     """
 
+    # default_channel_id parsed on first use by _default_channel()
+    _default_channel_id_int: int | None = None
+
     DOCS: ClassVar[IntegrationDocs] = IntegrationDocs(
         name="discord",
         description="Send messages and interact with Discord servers (guilds).",
@@ -179,14 +394,14 @@ class DiscordIntegration(BaseIntegration):
             ),
             ParamDoc(
                 name="default_channel_id",
-                type="str",
+                type="int | str",
                 description="Default channel ID for post() method",
                 required=False,
                 default="None",
             ),
             ParamDoc(
                 name="default_guild_id",
-                type="str",
+                type="int | str",
                 description="Default guild (server) ID for operations",
                 required=False,
                 default="None",
@@ -214,13 +429,27 @@ class DiscordIntegration(BaseIntegration):
                 returns="dict - Discord API response with message id and channel_id",
                 example='discord.post("Deployment completed successfully!")',
             ),
+            MethodDoc(
+                name="post_many",
+                description="Send several messages to the default channel concurrently.",
+                params=[
+                    ParamDoc(
+                        name="messages",
+                        type="list[str]",
+                        description="Message texts to send",
+                        required=True,
+                    ),
+                ],
+                returns="list[dict | Exception] - One result per message, in order; failed sends are returned as the exception",
+                example='discord.post_many(["Build started", "Tests passed", "Deployed"])',
+            ),
             MethodDoc(
                 name="send_message",
                 description="Send a message to a specific channel.",
                 params=[
                     ParamDoc(
                         name="channel_id",
-                        type="str",
+                        type="int | str",
                         description="Discord channel ID",
                         required=True,
                     ),
@@ -241,13 +470,33 @@ class DiscordIntegration(BaseIntegration):
                 returns="dict - Discord API response",
                 example='discord.send_message("123456789", "Hello from Wren!")',
             ),
+            MethodDoc(
+                name="send_messages",
+                description="Send several messages to a specific channel concurrently.",
+                params=[
+                    ParamDoc(
+                        name="channel_id",
+                        type="int | str",
+                        description="Discord channel ID",
+                        required=True,
+                    ),
+                    ParamDoc(
+                        name="contents",
+                        type="list[str]",
+                        description="Message texts to send",
+                        required=True,
+                    ),
+                ],
+                returns="list[dict | Exception] - One result per message, in order; failed sends are returned as the exception",
+                example='discord.send_messages("123456789", ["Step 1 done", "Step 2 done"])',
+            ),
             MethodDoc(
                 name="get_messages",
                 description="Get recent messages from a channel.",
                 params=[
                     ParamDoc(
                         name="channel_id",
-                        type="str",
+                        type="int | str",
                         description="Discord channel ID",
                         required=True,
                     ),
@@ -274,7 +523,7 @@ class DiscordIntegration(BaseIntegration):
                     ),
                     ParamDoc(
                         name="guild_id",
-                        type="str",
+                        type="int | str",
                         description="Guild ID (uses default_guild_id if not provided)",
                         required=False,
                         default="None",
@@ -296,13 +545,13 @@ class DiscordIntegration(BaseIntegration):
                 params=[
                     ParamDoc(
                         name="channel_id",
-                        type="str",
+                        type="int | str",
                         description="Discord channel ID",
                         required=True,
                     ),
                     ParamDoc(
                         name="message_id",
-                        type="str",
+                        type="int | str",
                         description="Message ID to react to",
                         required=True,
                     ),
@@ -337,19 +586,46 @@ def daily_weather():
             )
         self._client = DiscordClient(token)
 
+    def disconnect(self) -> None:
+        """Close the Discord HTTP session and reset state."""
+        if self._client is not None:
+            self._client.close()
+        super().disconnect()
+
     @property
-    def default_channel_id(self) -> str | None:
+    def default_channel_id(self) -> int | str | None:
         """Get the configured default channel ID."""
         return self._config.get("default_channel_id")
 
     @property
-    def default_guild_id(self) -> str | None:
+    def default_guild_id(self) -> int | str | None:
         """Get the configured default guild ID."""
         return self._config.get("default_guild_id")
 
+    def _default_channel(self) -> int:
+        """Connect and return the default channel ID as int, parsing it once."""
+        channel_id = self._default_channel_id_int
+        if channel_id is None:
+            raw = self.default_channel_id
+            if not raw:
+                raise ValueError(
+                    "No default_channel_id configured. "
+                    "Pass default_channel_id= to init() or use send_message() instead."
+                )
+            try:
+                channel_id = _to_int(raw)
+            except ValueError:
+                raise ValueError(
+                    f"default_channel_id must be a numeric Discord ID, got {raw!r}. "
+                    "Enable Developer Mode in Discord and use Copy Channel ID."
+                ) from None
+            self._default_channel_id_int = channel_id
+        self._ensure_connected()
+        return channel_id
+
     def send_message(
         self,
-        channel_id: str,
+        channel_id: int | str,
         content: str,
         embed: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
@@ -385,16 +661,52 @@ def daily_weather():
         Raises:
             ValueError: If no default_channel_id is configured
         """
-        if not self.default_channel_id:
-            raise ValueError(
-                "No default_channel_id configured. "
-                "Pass default_channel_id= to init() or use send_message() instead."
-            )
-        return self.send_message(self.default_channel_id, content, embed)
+        channel_id = self._default_channel()
+        return self._client.send_message(channel_id, content, embed)
+
+    def post_many(self, messages: list[str]) -> list[dict[str, Any] | BaseException]:
+        """
+        Send several messages to the default channel concurrently.
+
+        Args:
+            messages: Message texts to send
+
+        Returns:
+            One entry per message, in order: the message dict, or the
+            exception raised for that message if it failed
+
+        Raises:
+            ValueError: If no default_channel_id is configured
+        """
+        return self.send_messages(self._default_channel(), messages)
+
+    def send_messages(
+        self,
+        channel_id: int | str,
+        contents: list[str],
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Send several messages to a specific channel concurrently.
+
+        All messages go out on one event-loop turn through the shared
+        client session, so the channel is fetched once and the sends
+        overlap instead of running back to back.
+
+        Args:
+            channel_id: Discord channel ID
+            contents: Message texts to send
+
+        Returns:
+            One entry per message, in order: the message dict, or the
+            exception raised for that message if it failed
+        """
+        self._ensure_connected()
+        cid = _to_int(channel_id)
+        return self._client.send_messages([(cid, content, None) for content in contents])
 
     def get_messages(
         self,
-        channel_id: str,
+        channel_id: int | str,
         limit: int = 50,
     ) -> list[DiscordMessage]:
         """
@@ -413,7 +725,7 @@ def daily_weather():
     def create_channel(
         self,
         name: str,
-        guild_id: str | None = None,
+        guild_id: int | str | None = None,
         channel_type: str = "text",
     ) -> dict[str, Any]:
         """
@@ -441,8 +753,8 @@ def daily_weather():
 
     def add_reaction(
         self,
-        channel_id: str,
-        message_id: str,
+        channel_id: int | str,
+        message_id: int | str,
         emoji: str,
     ) -> None:
         """
@@ -15,12 +15,19 @@ is needed so the agent knows to warn users about setup requirements.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install wren[speedups]
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Mapping, Sequence
 
 
 class AuthType(Enum):
@@ -37,7 +44,17 @@ class AuthType(Enum):
     TOKEN = "token"  # Requires bearer token
 
 
-@dataclass
+# "**Requires:**" line text for every auth type that needs setup
+_AUTH_DESC: Final[Mapping[AuthType, str]] = MappingProxyType(
+    {
+        AuthType.OAUTH: "OAuth authentication (configure in platform)",
+        AuthType.API_KEY: "API key (configure in platform)",
+        AuthType.TOKEN: "Access token (configure in platform)",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ParamDoc:
     """Documentation for a method parameter or init parameter."""
 
@@ -46,46 +63,65 @@ class ParamDoc:
     description: str
     required: bool = True
     default: str | None = None
+    _markdown: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def render_markdown(self) -> str:
-        """Render parameter as markdown list item."""
+        """Render parameter as markdown list item (cached after first call)."""
+        if self._markdown is not None:
+            return self._markdown
+
         req = "" if self.required else " (optional)"
         default = f", default: `{self.default}`" if self.default else ""
-        return f"  - `{self.name}` ({self.type}{req}): {self.description}{default}"
+        markdown = f"  - `{self.name}` ({self.type}{req}): {self.description}{default}"
+        object.__setattr__(self, "_markdown", markdown)
+        return markdown
+
 
+def _params_section(title: str, params: Sequence[ParamDoc]) -> str:
+    """Render a ``**title:**`` block listing params, or "" when there are none."""
+    if not params:
+        return ""
+    rendered = "".join(f"{p.render_markdown()}\n" for p in params)
+    return f"**{title}:**\n{rendered}\n"
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MethodDoc:
     """Documentation for an integration method."""
 
     name: str
     description: str
-    params: list[ParamDoc] = field(default_factory=list)
+    params: Sequence[ParamDoc] = ()
     returns: str = "None"
     example: str | None = None
+    _markdown: str | None = field(default=None, init=False, repr=False, compare=False)
 
-    def render_markdown(self) -> str:
-        """Render method as markdown section."""
-        lines = [f"#### `{self.name}()`", "", self.description, ""]
-
-        if self.params:
-            lines.append("**Parameters:**")
-            for param in self.params:
-                lines.append(param.render_markdown())
-            lines.append("")
+    def __post_init__(self) -> None:
+        # Accept lists for convenience but store tuples so docs stay immutable
+        object.__setattr__(self, "params", tuple(self.params))
 
-        lines.append(f"**Returns:** {self.returns}")
+    def render_markdown(self) -> str:
+        """Render method as markdown section (cached after first call)."""
+        if self._markdown is not None:
+            return self._markdown
 
-        if self.example:
-            lines.extend(["", "**Example:**", "```python", self.example, "```"])
+        params = _params_section("Parameters", self.params)
+        example = f"\n\n**Example:**\n```python\n{self.example}\n```" if self.example else ""
 
-        return "\n".join(lines)
+        markdown = (
+            f"#### `{self.name}()`\n\n{self.description}\n\n"
+            f"{params}**Returns:** {self.returns}{example}"
+        )
+        object.__setattr__(self, "_markdown", markdown)
+        return markdown
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntegrationDocs:
     """Complete documentation for an integration.
 
+    Instances are frozen, so rendered output is computed once and reused.
+
     NOTE: Detailed credential specs (OAuth scopes, setup URLs, env var mappings)
     are defined in the backend. The SDK only indicates the auth TYPE so the
     agent knows to warn users about setup requirements.
@@ -93,45 +129,65 @@ class IntegrationDocs:
 
     name: str
     description: str
-    methods: list[MethodDoc] = field(default_factory=list)
-    init_params: list[ParamDoc] = field(default_factory=list)
+    methods: Sequence[MethodDoc] = ()
+    init_params: Sequence[ParamDoc] = ()
     example: str | None = None
     auth_type: AuthType = AuthType.NONE  # What kind of auth is needed
+    _markdown: str | None = field(default=None, init=False, repr=False, compare=False)
+    _dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _json: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    _method_names: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Accept lists for convenience but store tuples so docs stay immutable
+        object.__setattr__(self, "methods", tuple(self.methods))
+        object.__setattr__(self, "init_params", tuple(self.init_params))
+
+    @property
+    def method_names(self) -> frozenset[str]:
+        """Names of the documented methods (cached after first access)."""
+        if self._method_names is not None:
+            return self._method_names
+
+        names = frozenset(m.name for m in self.methods)
+        object.__setattr__(self, "_method_names", names)
+        return names
 
     def render_markdown(self) -> str:
-        """Render complete integration docs as markdown."""
-        lines = [f"### {self.name}", "", self.description, ""]
-
-        if self.auth_type != AuthType.NONE:
-            auth_desc = {
-                AuthType.OAUTH: "OAuth authentication (configure in platform)",
-                AuthType.API_KEY: "API key (configure in platform)",
-                AuthType.TOKEN: "Access token (configure in platform)",
-            }
-            lines.append(f"**Requires:** {auth_desc.get(self.auth_type, 'Authentication')}")
-            lines.append("")
-
-        if self.init_params:
-            lines.append("**Init Parameters:**")
-            for param in self.init_params:
-                lines.append(param.render_markdown())
-            lines.append("")
+        """Render complete integration docs as markdown (cached after first call)."""
+        if self._markdown is not None:
+            return self._markdown
 
-        if self.example:
-            lines.extend(["**Quick Example:**", "```python", self.example, "```", ""])
+        # AuthType.NONE has no entry, so it renders no "Requires" line
+        requires = _AUTH_DESC.get(self.auth_type)
+        auth = f"**Requires:** {requires}\n\n" if requires else ""
 
-        if self.methods:
-            lines.append("**Methods:**")
-            lines.append("")
-            for method in self.methods:
-                lines.append(method.render_markdown())
-                lines.append("")
+        init_params = _params_section("Init Parameters", self.init_params)
 
-        return "\n".join(lines)
+        example = ""
+        if self.example:
+            example = f"**Quick Example:**\n```python\n{self.example}\n```\n\n"
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        methods = ""
+        if self.methods:
+            rendered = "".join(f"{m.render_markdown()}\n\n" for m in self.methods)
+            methods = f"**Methods:**\n\n{rendered}"
+
+        # Every section ends with a newline; drop the final one
+        markdown = (
+            f"### {self.name}\n\n{self.description}\n\n{auth}{init_params}{example}{methods}"
+        )[:-1]
+        object.__setattr__(self, "_markdown", markdown)
+        return markdown
+
+    def _as_dict(self) -> dict:
+        """Build the dict form once; private, so callers never see the shared copy."""
+        if self._dict is not None:
+            return self._dict
+
+        d = {
             "name": self.name,
             "description": self.description,
             "methods": [
@@ -166,6 +222,64 @@ class IntegrationDocs:
             "example": self.example,
             "auth_type": self.auth_type.value,
         }
+        object.__setattr__(self, "_dict", d)
+        return d
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization (a fresh copy on each call)."""
+        d = self._as_dict()
+        return {
+            **d,
+            "methods": [{**m, "params": [dict(p) for p in m["params"]]} for m in d["methods"]],
+            "init_params": [dict(p) for p in d["init_params"]],
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Return to_dict() as indented UTF-8 JSON (cached; uses orjson if installed)."""
+        if self._json is not None:
+            return self._json
+
+        if orjson is not None:
+            data = orjson.dumps(self._as_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self._as_dict(), indent=2, ensure_ascii=False).encode()
+        object.__setattr__(self, "_json", data)
+        return data
+
+    def to_json(self) -> str:
+        """Return to_dict() as indented JSON text."""
+        return self.to_json_bytes().decode()
+
+
+_DOCS_HEADER: Final = (
+    "# Wren Integrations Reference\n\nAvailable integrations for use in Wren scripts.\n"
+)
+
+
+class LazyDocs:
+    """Class attribute that builds an integration's IntegrationDocs on first access.
+
+    Lets modules define DOCS without constructing every ParamDoc/MethodDoc at
+    import time::
+
+        def _build_docs() -> IntegrationDocs:
+            return IntegrationDocs(...)
+
+        class MyIntegration(BaseIntegration):
+            DOCS = LazyDocs(_build_docs)
+    """
+
+    __slots__ = ("_factory", "_docs")
+
+    def __init__(self, factory: Callable[[], IntegrationDocs]) -> None:
+        self._factory = factory
+        self._docs: IntegrationDocs | None = None
+
+    def __get__(self, obj: object, owner: type | None = None) -> IntegrationDocs:
+        docs = self._docs
+        if docs is None:
+            docs = self._docs = self._factory()
+        return docs
 
 
 def render_all_docs(docs: Sequence[IntegrationDocs]) -> str:
@@ -178,16 +292,6 @@ def render_all_docs(docs: Sequence[IntegrationDocs]) -> str:
     Returns:
         Complete markdown string with all integrations documented
     """
-    lines = [
-        "# Wren Integrations Reference",
-        "",
-        "Available integrations for use in Wren scripts.",
-        "",
-    ]
-
-    for doc in docs:
-        lines.append(doc.render_markdown())
-        lines.append("---")
-        lines.append("")
-
-    return "\n".join(lines)
+    parts = [_DOCS_HEADER]
+    parts.extend(f"{doc.render_markdown()}\n---\n" for doc in docs)
+    return "\n".join(parts)
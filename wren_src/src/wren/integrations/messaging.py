@@ -18,63 +18,182 @@ Usage:
 
 from __future__ import annotations
 
+import os
+import sys
+import time
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, ClassVar
+from types import MappingProxyType
+from typing import Any
 
 from . import register_integration
 from .base import BaseIntegration
-from .docs import IntegrationDocs, MethodDoc, ParamDoc
+from .docs import IntegrationDocs, LazyDocs, MethodDoc, ParamDoc
 
+# Set WREN_TIMESTAMP_CACHE=1 to reuse one timestamp for sends within _NOW_TTL seconds
+_TIMESTAMP_CACHE = os.environ.get("WREN_TIMESTAMP_CACHE") == "1"
+_NOW_TTL = 0.01
 
-@dataclass
+_now_expires = 0.0
+_now_cached: tuple[datetime, str] | None = None
+
+
+def _now() -> tuple[datetime, str]:
+    """Return the current time and its isoformat(), cached briefly if enabled."""
+    global _now_expires, _now_cached
+    if not _TIMESTAMP_CACHE:
+        now = datetime.now()
+        return now, now.isoformat()
+
+    tick = time.monotonic()
+    if _now_cached is None or tick > _now_expires:
+        now = datetime.now()
+        _now_cached = (now, now.isoformat())
+        _now_expires = tick + _NOW_TTL
+    return _now_cached
+
+
+# Shared read-only metadata for messages sent without extra options
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, Any]:
+    return _EMPTY_METADATA
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a sent message (for mock tracking)."""
 
     channel: str
     text: str
-    timestamp: datetime = field(default_factory=datetime.now)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    # None means "now"; the client always passes its send time explicitly
+    timestamp: datetime = None  # type: ignore[assignment]
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
+
+    def __post_init__(self) -> None:
+        if self.timestamp is None:
+            self.timestamp = _now()[0]
 
 
 class MockMessagingClient:
-    """Mock client that tracks sent messages."""
+    """Mock client that tracks sent messages.
+
+    History is stored as parallel per-field lists so scans (e.g. by channel)
+    touch a single list; Message objects are built only when read. Channel
+    names (which must be ``str``) are interned, so repeated names share one
+    object.
+
+    Set ``expected_messages`` in the config to pre-size the history when the
+    number of sends is known up front.
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = config
-        self._messages: list[Message] = []
+        self._expected = config.get("expected_messages", 0)
+        self._reset()
+
+    def _reset(self) -> None:
+        # Slots past _count are unused pre-sized space (None)
+        n = self._expected
+        self._channels: list[Any] = [None] * n
+        self._texts: list[Any] = [None] * n
+        self._timestamps: list[Any] = [None] * n
+        self._metadata: list[Any] = [None] * n
+        self._count = 0
 
     def send(self, channel: str, text: str, **kwargs: Any) -> dict[str, Any]:
         """Send a message and return confirmation."""
-        msg = Message(channel=channel, text=text, metadata=kwargs)
-        self._messages.append(msg)
+        channel = sys.intern(channel)
+        timestamp, ts = _now()
+        metadata = kwargs or _EMPTY_METADATA
+        i = self._count
+        if i < len(self._channels):
+            self._channels[i] = channel
+            self._texts[i] = text
+            self._timestamps[i] = timestamp
+            self._metadata[i] = metadata
+        else:
+            self._channels.append(channel)
+            self._texts.append(text)
+            self._timestamps.append(timestamp)
+            self._metadata.append(metadata)
+        self._count = i + 1
         return {
             "ok": True,
             "channel": channel,
-            "ts": msg.timestamp.isoformat(),
+            "ts": ts,
             "message": {"text": text},
         }
 
+    def send_batch(self, items: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Send several (channel, text) messages at once and return their confirmations."""
+        timestamp, ts = _now()
+        n = len(items)
+        start = self._count
+        end = start + n
+        # Fills pre-sized slots first and grows each list once for any overflow
+        self._channels[start:end] = [sys.intern(channel) for channel, _ in items]
+        self._texts[start:end] = [text for _, text in items]
+        self._timestamps[start:end] = [timestamp] * n
+        self._metadata[start:end] = [_EMPTY_METADATA] * n
+        self._count = end
+        return [
+            {
+                "ok": True,
+                "channel": channel,
+                "ts": ts,
+                "message": {"text": text},
+            }
+            for channel, text in items
+        ]
+
+    def _message(self, i: int) -> Message:
+        return Message(self._channels[i], self._texts[i], self._timestamps[i], self._metadata[i])
+
     @property
     def sent_messages(self) -> list[Message]:
         """Return all sent messages (for testing)."""
-        return list(self._messages)
+        n = self._count
+        return [
+            Message(channel, text, timestamp, metadata)
+            for channel, text, timestamp, metadata in zip(
+                self._channels[:n],
+                self._texts[:n],
+                self._timestamps[:n],
+                self._metadata[:n],
+                strict=True,
+            )
+        ]
+
+    def iter_messages(self) -> Iterator[Message]:
+        """Yield messages sent before iteration began, without copying the history.
+
+        clear() swaps in new lists, so holding the current ones keeps the
+        iteration intact if the history is cleared part-way through.
+        """
+        channels, texts, timestamps, metadata = (
+            self._channels,
+            self._texts,
+            self._timestamps,
+            self._metadata,
+        )
+        for i in range(self._count):
+            yield Message(channels[i], texts[i], timestamps[i], metadata[i])
+
+    def filter_by_channel(self, channel: str) -> list[Message]:
+        """Return sent messages for one channel, scanning only the channel list."""
+        channels = self._channels
+        return [self._message(i) for i in range(self._count) if channels[i] == channel]
 
     def clear(self) -> None:
         """Clear sent messages (for testing)."""
-        self._messages.clear()
+        self._reset()
 
 
-@register_integration("messaging")
-class MessagingIntegration(BaseIntegration):
-    """
-    Mock messaging integration (Slack/Teams-like).
-
-    Provides a simple API for sending messages. In production,
-    this would connect to an actual messaging service.
-    """
-
-    DOCS: ClassVar[IntegrationDocs] = IntegrationDocs(
+def _build_docs() -> IntegrationDocs:
+    return IntegrationDocs(
         name="messaging",
         description="Generic messaging integration for Slack/Teams-like platforms. Use this for quick prototyping or when the specific platform doesn't matter.",
         init_params=[
@@ -101,6 +220,20 @@ class MessagingIntegration(BaseIntegration):
                 returns="dict - API response with ok, channel, ts, message",
                 example='messaging.post("Build completed!")',
             ),
+            MethodDoc(
+                name="post_batch",
+                description="Post several messages to the default channel in one call.",
+                params=[
+                    ParamDoc(
+                        name="messages",
+                        type="list[str]",
+                        description="Message texts to post",
+                        required=True,
+                    ),
+                ],
+                returns="list[dict] - One API response per message, in order",
+                example='messaging.post_batch(["Build started", "Build completed!"])',
+            ),
             MethodDoc(
                 name="send_message",
                 description="Send a message to a specific channel.",
@@ -132,13 +265,30 @@ def health_check():
         messaging.post("Server health check failed!")""",
     )
 
+
+@register_integration("messaging")
+class MessagingIntegration(BaseIntegration):
+    """
+    Mock messaging integration (Slack/Teams-like).
+
+    Provides a simple API for sending messages. In production,
+    this would connect to an actual messaging service.
+    """
+
+    DOCS = LazyDocs(_build_docs)
+
     def _connect(self) -> None:
         """Initialize the mock client."""
         self._client = MockMessagingClient(self._config)
+        # Bound once so send_message()/post() skip the client attribute lookup
+        self._send_impl = self._client.send
+        self._default_channel = sys.intern(self._config.get("default_channel", "#general"))
 
     @property
     def default_channel(self) -> str:
         """Get the configured default channel."""
+        if self._connected:
+            return self._default_channel
         return self._config.get("default_channel", "#general")
 
     def send_message(self, channel: str, text: str, **kwargs: Any) -> dict[str, Any]:
@@ -153,8 +303,9 @@ def health_check():
         Returns:
             API response dict with ok, channel, ts, message
         """
-        self._ensure_connected()
-        return self._client.send(channel, text, **kwargs)
+        if not self._connected:
+            self._ensure_connected()
+        return self._send_impl(channel, text, **kwargs)
 
     def post(self, message: str, **kwargs: Any) -> dict[str, Any]:
         """
@@ -169,13 +320,34 @@ def health_check():
         Returns:
             API response dict
         """
-        return self.send_message(self.default_channel, message, **kwargs)
+        if not self._connected:
+            self._ensure_connected()
+        return self._send_impl(self._default_channel, message, **kwargs)
+
+    def post_batch(self, messages: list[str]) -> list[dict[str, Any]]:
+        """
+        Post several messages to the default channel in one call.
+
+        Args:
+            messages: Message contents
+
+        Returns:
+            One API response dict per message, in order
+        """
+        self._ensure_connected()
+        channel = self._default_channel
+        return self._client.send_batch([(channel, message) for message in messages])
 
     def get_sent_messages(self) -> list[Message]:
         """Return sent messages (for testing/debugging)."""
         self._ensure_connected()
         return self._client.sent_messages
 
+    def iter_sent_messages(self) -> Iterator[Message]:
+        """Iterate sent messages without copying the history (for testing/debugging)."""
+        self._ensure_connected()
+        return self._client.iter_messages()
+
     def clear_messages(self) -> None:
         """Clear message history (for testing)."""
         if self._connected and self._client:
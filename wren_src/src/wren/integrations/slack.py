@@ -7,18 +7,13 @@ fails on method calls until a real implementation is provided.
 
 from __future__ import annotations
 
-from typing import ClassVar
-
 from . import register_integration
-from .docs import AuthType, IntegrationDocs, MethodDoc, ParamDoc
+from .docs import AuthType, IntegrationDocs, LazyDocs, MethodDoc, ParamDoc
 from .stub import StubIntegration
 
 
-@register_integration("slack")
-class SlackIntegration(StubIntegration):
-    """Stub Slack integration."""
-
-    DOCS: ClassVar[IntegrationDocs] = IntegrationDocs(
+def _build_docs() -> IntegrationDocs:
+    return IntegrationDocs(
         name="slack",
         description="Send messages and interact with Slack workspaces.",
         auth_type=AuthType.OAUTH,
@@ -104,3 +99,10 @@ def handle_alert(email):
     summary = wren.ai.summarize(email.body, max_length=200)
     slack.post(f"PagerDuty Alert: {summary}")""",
     )
+
+
+@register_integration("slack")
+class SlackIntegration(StubIntegration):
+    """Stub Slack integration."""
+
+    DOCS = LazyDocs(_build_docs)
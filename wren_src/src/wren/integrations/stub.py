@@ -8,11 +8,13 @@ and early SDK usage without real implementations.
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseIntegration
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class StubIntegration(BaseIntegration):
     """Generic stub integration with lazy method proxies."""
@@ -32,4 +34,6 @@ class StubIntegration(BaseIntegration):
                 "Install or provide a real integration client before calling it."
             )
 
+        # Cache on the instance so later lookups of this name skip __getattr__
+        object.__setattr__(self, name, _missing)
         return _missing
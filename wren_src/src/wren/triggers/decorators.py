@@ -26,6 +26,17 @@ from ..core.registry import registry
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _trigger_decorator(trigger_type: str, config: dict[str, Any]) -> Callable[[F], F]:
+    """Return a decorator that registers a function as a ``trigger_type`` trigger."""
+
+    def decorator(func: F) -> F:
+        # Copy per function so functions sharing one decorator never share a config
+        registry.register_trigger(trigger_type, dict(config), func)
+        return func
+
+    return decorator
+
+
 def on_schedule(cron: str, timezone: str | None = None) -> Callable[[F], F]:
     """
     Decorator to register a function for scheduled execution.
@@ -47,12 +58,7 @@ def on_schedule(cron: str, timezone: str | None = None) -> Callable[[F], F]:
             check_for_updates()
     """
 
-    def decorator(func: F) -> F:
-        config = {"cron": cron, "timezone": timezone}
-        registry.register_trigger("schedule", config, func)
-        return func
-
-    return decorator
+    return _trigger_decorator("schedule", {"cron": cron, "timezone": timezone})
 
 
 def on_email(filter: dict[str, Any] | None = None, **filter_kwargs: Any) -> Callable[[F], F]:
@@ -82,14 +88,12 @@ def on_email(filter: dict[str, Any] | None = None, **filter_kwargs: Any) -> Call
         def handle_urgent(email):
             notify_team(email)
     """
-    # Support both filter dict and kwargs
-    filter_config = filter or {}
-    if filter_kwargs:
-        filter_config = {**filter_config, **filter_kwargs}
-
-    def decorator(func: F) -> F:
-        config = {"filter": filter_config}
-        registry.register_trigger("email", config, func)
-        return func
-
-    return decorator
+    # Support both filter dict and kwargs; only merge when both are given
+    if filter and filter_kwargs:
+        filter_config = {**filter, **filter_kwargs}
+    elif filter_kwargs:
+        filter_config = filter_kwargs
+    else:
+        filter_config = filter or {}
+
+    return _trigger_decorator("email", {"filter": filter_config})
@@ -0,0 +1,194 @@
+"""Tests for wren.errors.classifier module."""
+
+import pytest
+
+from wren.errors.classifier import (
+    ClassifiedError,
+    ErrorLocation,
+    classify_exception,
+    format_error_for_agent,
+)
+
+
+def raise_and_catch(exc: Exception) -> Exception:
+    """Raise an exception so it carries a traceback, then return it."""
+    try:
+        raise exc
+    except Exception as caught:
+        return caught
+
+
+class TestClassifyException:
+    """Test classify_exception()."""
+
+    def test_name_error_wren_integration_hint(self):
+        """NameError for an integration name should suggest the init pattern."""
+        exc = raise_and_catch(NameError("name 'gmail' is not defined"))
+        classified = classify_exception(exc)
+
+        assert isinstance(classified, ClassifiedError)
+        assert classified.error_code == "NAME_ERROR"
+        assert "wren.integrations import gmail" in classified.fix_hint
+        assert isinstance(classified.location, ErrorLocation)
+
+    def test_syntax_error_location(self):
+        """SyntaxError should use the filename/line/offset from the exception."""
+        exc = SyntaxError("invalid syntax", ("script.py", 3, 7, "def f(:\n"))
+        classified = classify_exception(exc)
+
+        assert classified.error_code == "SYNTAX_ERROR"
+        assert classified.message == "invalid syntax"
+        assert classified.location == ErrorLocation(file="script.py", line=3, col=7)
+
+    def test_auth_error(self):
+        """Credential-related messages should be user-facing config errors."""
+        classified = classify_exception(RuntimeError("401 Unauthorized"))
+
+        assert classified.error_type == "UserFacingConfigError"
+        assert classified.error_code == "AUTH_ERROR"
+
+    def test_message_uses_str_override(self):
+        """Exceptions with a custom __str__ should keep their formatting."""
+        classified = classify_exception(KeyError("missing"))
+
+        assert classified.message == "'missing'"
+        assert classified.original_error == "KeyError: 'missing'"
+
+
+AGENT = "AgentFixableError"
+
+# (exception, expected dict, whether the raise site is added as "location")
+FORMAT_CASES = [
+    (
+        SyntaxError("unexpected indent", ("script.py", 2, 4, "    x = 1\n")),
+        {
+            "error_type": AGENT,
+            "error_code": "SYNTAX_ERROR",
+            "message": "unexpected indent",
+            "fix_hint": "Remove extra indentation or align with the previous line.",
+            "location": {"file": "script.py", "line": 2, "col": 4},
+            "original_error": "SyntaxError: unexpected indent",
+        },
+        False,
+    ),
+    (
+        SyntaxError("unterminated string literal"),
+        {
+            "error_type": AGENT,
+            "error_code": "SYNTAX_ERROR",
+            "message": "unterminated string literal",
+            "fix_hint": "Close the string with a matching quote.",
+            "original_error": "SyntaxError: unterminated string literal",
+        },
+        False,
+    ),
+    (
+        NameError("name 'foo' is not defined"),
+        {
+            "error_type": AGENT,
+            "error_code": "NAME_ERROR",
+            "message": "name 'foo' is not defined",
+            "fix_hint": "'foo' is not defined. Check spelling or add the missing import.",
+            "original_error": "NameError: name 'foo' is not defined",
+        },
+        True,
+    ),
+    (
+        ModuleNotFoundError("No module named 'requests'"),
+        {
+            "error_type": AGENT,
+            "error_code": "IMPORT_ERROR",
+            "message": "No module named 'requests'",
+            "fix_hint": "Install missing package: pip install requests",
+            "original_error": "ModuleNotFoundError: No module named 'requests'",
+        },
+        True,
+    ),
+    (
+        TypeError("f() missing 1 required positional argument: 'x'"),
+        {
+            "error_type": AGENT,
+            "error_code": "TYPE_ERROR",
+            "message": "f() missing 1 required positional argument: 'x'",
+            "fix_hint": "Check the number of arguments passed to the function.",
+            "original_error": "TypeError: f() missing 1 required positional argument: 'x'",
+        },
+        True,
+    ),
+    (
+        AttributeError("'NoneType' object has no attribute 'post'"),
+        {
+            "error_type": AGENT,
+            "error_code": "ATTRIBUTE_ERROR",
+            "message": "'NoneType' object has no attribute 'post'",
+            "fix_hint": "'NoneType' has no attribute 'post'. Check spelling or API documentation.",
+            "original_error": "AttributeError: 'NoneType' object has no attribute 'post'",
+        },
+        True,
+    ),
+    (
+        ValueError("Invalid cron expression"),
+        {
+            "error_type": AGENT,
+            "error_code": "VALUE_ERROR",
+            "message": "Invalid cron expression",
+            "fix_hint": (
+                "Fix the cron expression. Format: 'minute hour day month weekday' "
+                "(e.g., '0 9 * * 1-5')."
+            ),
+            "original_error": "ValueError: Invalid cron expression",
+        },
+        True,
+    ),
+    (
+        FileNotFoundError(2, "No such file or directory", "data.csv"),
+        {
+            "error_type": AGENT,
+            "error_code": "FILE_NOT_FOUND",
+            "message": "[Errno 2] No such file or directory: 'data.csv'",
+            "fix_hint": (
+                "Check the file path. Use absolute paths or paths relative to the script location."
+            ),
+            "original_error": "FileNotFoundError: [Errno 2] No such file or directory: 'data.csv'",
+        },
+        False,
+    ),
+    (
+        PermissionError("Invalid API key"),
+        {
+            "error_type": "UserFacingConfigError",
+            "error_code": "AUTH_ERROR",
+            "message": "Invalid API key",
+            "fix_hint": "Configure credentials via the platform UI or environment variables.",
+            "original_error": "PermissionError: Invalid API key",
+        },
+        False,
+    ),
+    (
+        RuntimeError("boom"),
+        {
+            "error_type": AGENT,
+            "error_code": "RUNTIME_ERROR",
+            "message": "boom",
+            "fix_hint": "Check the error message and fix the underlying issue.",
+            "original_error": "RuntimeError: boom",
+        },
+        True,
+    ),
+]
+
+
+class TestFormatErrorForAgent:
+    """Test format_error_for_agent() fast path."""
+
+    @pytest.mark.parametrize(("exc", "expected", "traceback_location"), FORMAT_CASES)
+    def test_expected_dict(self, exc, expected, traceback_location):
+        """Both the dict fast path and ClassifiedError.to_dict() should give the expected dict."""
+        exc = raise_and_catch(exc)
+        expected = dict(expected)
+        if traceback_location:
+            # Located at the raise inside raise_and_catch()
+            expected["location"] = {"file": __file__, "line": exc.__traceback__.tb_lineno}
+
+        assert format_error_for_agent(exc) == expected
+        assert classify_exception(exc).to_dict() == expected
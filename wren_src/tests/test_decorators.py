@@ -164,6 +164,25 @@ class TestDecoratorInteraction:
         assert len(schedules) == 1
         assert len(emails) == 1
 
+    def test_reused_decorator_gives_each_function_its_own_config(self, clean_registry):
+        """Functions decorated by one decorator object should not share a config dict."""
+        every_morning = on_schedule("0 9 * * *")
+
+        @every_morning
+        def first():
+            pass
+
+        @every_morning
+        def second():
+            pass
+
+        first_entry, second_entry = clean_registry.get_triggers_by_type("schedule")
+        assert first_entry.config == second_entry.config
+        assert first_entry.config is not second_entry.config
+
+        first_entry.config["timezone"] = "UTC"
+        assert second_entry.config["timezone"] is None
+
     def test_import_style_usage(self, clean_registry):
         """Test wren.on_schedule style imports work."""
         import wren
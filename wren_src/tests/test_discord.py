@@ -0,0 +1,314 @@
+"""Tests for wren.integrations.discord's DiscordClient, using fake discord.py clients."""
+
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+discord = pytest.importorskip("discord")
+
+from wren.core.registry import registry  # noqa: E402
+from wren.integrations import integrations  # noqa: E402
+from wren.integrations.discord import DiscordClient  # noqa: E402
+
+discord_integration = sys.modules["wren.integrations.discord"]
+
+
+@pytest.fixture
+def clean_registry():
+    """Provide a clean registry for each test."""
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+@pytest.fixture
+def client():
+    """A DiscordClient that never logs in; tests pass fake clients to its coroutines."""
+    return DiscordClient("token")
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    """Make retry waits exactly retry_after, so rate-limit tests run instantly."""
+    monkeypatch.setattr(discord_integration, "_MAX_JITTER", 0.0)
+
+
+def flaky(*failures, result="done"):
+    """Return a coroutine factory that raises each failure in turn, then returns result."""
+    calls = []
+
+    async def factory():
+        calls.append(None)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return result
+
+    factory.calls = calls
+    return factory
+
+
+def http_error(status: int):
+    """Build a discord.HTTPException for the given status code."""
+    return discord.HTTPException(SimpleNamespace(status=status, reason="error"), "error")
+
+
+class FakeHTTP:
+    """Stands in for discord.http.HTTPClient; send_message runs the given handler."""
+
+    def __init__(self, handler) -> None:
+        self.handler = handler
+        self.sent: list[int] = []
+
+    async def send_message(self, channel_id, params):
+        self.sent.append(channel_id)
+        return self.handler(channel_id, params)
+
+
+class FakeChannel:
+    """Stands in for a fetched text channel, recording public-API sends."""
+
+    def __init__(self, channel_id: int) -> None:
+        self.id = channel_id
+        self.sent: list[tuple[str, object]] = []
+
+    async def send(self, content, embed=None):
+        self.sent.append((content, embed))
+        return SimpleNamespace(
+            id=1,
+            channel=self,
+            content=content,
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+
+
+class FakeClient:
+    """Stands in for discord.Client, counting fetches and returning tagged objects."""
+
+    allowed_mentions = None
+
+    def __init__(self, delay: float = 0.0, http: FakeHTTP | None = None) -> None:
+        self.delay = delay
+        self.http = http
+        self.calls: list[tuple[str, int]] = []
+
+    async def fetch_channel(self, channel_id):
+        self.calls.append(("channel", channel_id))
+        await asyncio.sleep(self.delay)
+        return ("channel", channel_id)
+
+    async def fetch_guild(self, guild_id):
+        self.calls.append(("guild", guild_id))
+        await asyncio.sleep(self.delay)
+        return ("guild", guild_id)
+
+
+class TestRetry:
+    """Test DiscordClient._with_retry's retry policy."""
+
+    def test_retries_rate_limited(self, client, no_jitter):
+        """RateLimited should be retried until the call succeeds."""
+        factory = flaky(discord.RateLimited(0.0), discord.RateLimited(0.0))
+        assert asyncio.run(client._with_retry(factory)) == "done"
+        assert len(factory.calls) == 3
+
+    def test_gives_up_after_max_attempts(self, client, no_jitter):
+        """The last RateLimited should propagate once attempts run out."""
+        factory = flaky(*(discord.RateLimited(0.0) for _ in range(5)))
+        with pytest.raises(discord.RateLimited):
+            asyncio.run(client._with_retry(factory, max_attempts=3))
+        assert len(factory.calls) == 3
+
+    @pytest.mark.parametrize("status", [429, 500, 503, 404])
+    def test_http_errors_not_retried(self, client, status):
+        """HTTP errors, which discord.py already retried where safe, should propagate."""
+        factory = flaky(http_error(status))
+        with pytest.raises(discord.HTTPException):
+            asyncio.run(client._with_retry(factory))
+        assert len(factory.calls) == 1
+
+
+class TestFetchCache:
+    """Test channel/guild caching in DiscordClient."""
+
+    def test_cache_hit_skips_fetch(self, client):
+        """A second fetch within the TTL should reuse the cached object."""
+        fake = FakeClient()
+
+        async def run():
+            first = await client._fetch_channel(fake, 42)
+            second = await client._fetch_channel(fake, "42")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is second
+        assert fake.calls == [("channel", 42)]
+
+    def test_expired_entry_is_refetched(self, client):
+        """An entry older than the TTL should be fetched again."""
+        fake = FakeClient()
+        asyncio.run(client._fetch_channel(fake, 42))
+        obj, _ = client._channels[42]
+        client._channels[42] = (obj, time.monotonic() - discord_integration._CACHE_TTL - 1)
+
+        asyncio.run(client._fetch_channel(fake, 42))
+        assert fake.calls == [("channel", 42), ("channel", 42)]
+
+    def test_least_recently_used_entry_evicted(self, client, monkeypatch):
+        """Past the size limit, the least recently used entry should be dropped."""
+        monkeypatch.setattr(discord_integration, "_CACHE_MAX_SIZE", 2)
+        fake = FakeClient()
+
+        async def run():
+            await client._fetch_channel(fake, 1)
+            await client._fetch_channel(fake, 2)
+            await client._fetch_channel(fake, 1)
+            await client._fetch_channel(fake, 3)
+
+        asyncio.run(run())
+        assert list(client._channels) == [1, 3]
+        assert fake.calls == [("channel", 1), ("channel", 2), ("channel", 3)]
+
+    def test_concurrent_misses_share_one_fetch(self, client):
+        """Concurrent fetches of one uncached id should make a single request."""
+        fake = FakeClient(delay=0.01)
+
+        async def run():
+            return await asyncio.gather(*(client._fetch_channel(fake, 42) for _ in range(3)))
+
+        results = asyncio.run(run())
+        assert results == [("channel", 42)] * 3
+        assert fake.calls == [("channel", 42)]
+        assert client._pending_channels == {}
+
+    def test_concurrent_channel_and_guild_with_same_id(self, client):
+        """A guild fetch must not share a channel's in-flight fetch for the same id."""
+        fake = FakeClient(delay=0.01)
+
+        async def run():
+            return await asyncio.gather(
+                client._fetch_channel(fake, 42), client._fetch_guild(fake, 42)
+            )
+
+        channel, guild = asyncio.run(run())
+        assert channel == ("channel", 42)
+        assert guild == ("guild", 42)
+        assert sorted(fake.calls) == [("channel", 42), ("guild", 42)]
+
+
+class TestSendRawEmbed:
+    """Test sending embeds through the raw HTTP path."""
+
+    def test_embed_posted_as_raw_dict(self, client):
+        """The embed dict should reach send_message unchanged."""
+        seen = []
+
+        def ok(channel_id, params):
+            seen.append(params.payload["embeds"])
+            return {"id": "175928847299117063", "channel_id": "7", "content": "hi"}
+
+        fake = FakeClient(http=FakeHTTP(ok))
+        embed = {"title": "T", "color": 0xFF0000}
+
+        result = asyncio.run(client._send(fake, "7", "hi", embed))
+        assert seen == [[embed]]
+        assert fake.http.sent == [7]
+        assert result["id"] == "175928847299117063"
+        assert result["timestamp"].startswith("2016-04-30")
+
+    def test_falls_back_when_params_cannot_be_built(self, client, monkeypatch):
+        """If discord.py internals differ, the embed should go through channel.send()."""
+
+        def broken(*args, **kwargs):
+            raise TypeError("unexpected keyword argument")
+
+        monkeypatch.setattr(discord.http, "handle_message_parameters", broken)
+        channel = FakeChannel(7)
+        fake = FakeClient(http=FakeHTTP(lambda channel_id, params: {}))
+
+        async def fetch_channel(channel_id):
+            return channel
+
+        fake.fetch_channel = fetch_channel
+
+        result = asyncio.run(client._send(fake, 7, "hi", {"title": "T"}))
+        assert fake.http.sent == []
+        assert len(channel.sent) == 1
+        content, embed = channel.sent[0]
+        assert content == "hi"
+        assert isinstance(embed, discord.Embed)
+        assert embed.title == "T"
+        assert result["channel_id"] == "7"
+
+    def test_http_error_propagates_without_fallback(self, client):
+        """A failed POST should raise, not retry the send via channel.send()."""
+        channel = FakeChannel(7)
+
+        def fail(channel_id, params):
+            raise TypeError("response parsing failed")
+
+        fake = FakeClient(http=FakeHTTP(fail))
+
+        async def fetch_channel(channel_id):
+            return channel
+
+        fake.fetch_channel = fetch_channel
+
+        with pytest.raises(TypeError, match="response parsing failed"):
+            asyncio.run(client._send(fake, 7, "hi", {"title": "T"}))
+        assert fake.http.sent == [7]
+        assert channel.sent == []
+
+
+class TestSendMessages:
+    """Test DiscordClient.send_messages."""
+
+    def test_results_in_input_order_with_exceptions_in_place(self, client):
+        """Each result should line up with its item, failures included."""
+        error = http_error(403)
+
+        class SlowChannel(FakeChannel):
+            async def send(self, content, embed=None):
+                # Later items finish first, so completion order differs from input order
+                await asyncio.sleep(0.01 * (3 - self.id))
+                if content == "fail":
+                    raise error
+                return await super().send(content, embed)
+
+        channels = {cid: SlowChannel(cid) for cid in (1, 2, 3)}
+        fake = FakeClient()
+
+        async def fetch_channel(channel_id):
+            return channels[channel_id]
+
+        fake.fetch_channel = fetch_channel
+        client._client = fake
+
+        results = client.send_messages([(1, "a", None), (2, "fail", None), (3, "c", None)])
+        assert [r["content"] for r in (results[0], results[2])] == ["a", "c"]
+        assert [r["channel_id"] for r in (results[0], results[2])] == ["1", "3"]
+        assert results[1] is error
+
+
+class TestDiscordIntegration:
+    """Test DiscordIntegration's handling of its configuration."""
+
+    def test_bad_default_channel_only_fails_default_sends(self, clean_registry):
+        """A non-numeric default_channel_id should not break connecting."""
+        discord_int = integrations.discord.init(token="token", default_channel_id="#general")
+        discord_int._ensure_connected()
+        assert discord_int._connected
+
+        with pytest.raises(ValueError, match="must be a numeric Discord ID"):
+            discord_int.post("hi")
+        with pytest.raises(ValueError, match="must be a numeric Discord ID"):
+            discord_int.post_many(["hi"])
+
+    def test_default_channel_parsed_once(self, clean_registry):
+        """The default channel ID should be parsed to int and reused."""
+        discord_int = integrations.discord.init(token="token", default_channel_id="123")
+        assert discord_int._default_channel() == 123
+        assert discord_int._default_channel_id_int == 123
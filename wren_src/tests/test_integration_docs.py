@@ -1,14 +1,22 @@
 """Tests for the integration documentation system."""
 
+import dataclasses
+import json
+
+import pytest
+
 from wren.integrations import (
+    get_all_docs_markdown,
     get_integration_docs,
     integrations,
     list_integrations,
     render_integration_docs,
+    render_integration_docs_bytes,
 )
 from wren.integrations.docs import (
     AuthType,
     IntegrationDocs,
+    LazyDocs,
     MethodDoc,
     ParamDoc,
     render_all_docs,
@@ -45,6 +53,16 @@ class TestDocDataclasses:
         assert "(optional)" in rendered
         assert "default: `50`" in rendered
 
+    def test_param_doc_is_immutable(self):
+        """ParamDoc fields should not be assignable after construction."""
+        param = ParamDoc("a", "str", "An arg")
+        param.render_markdown()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            param.name = "b"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            del param.description
+        assert param == ParamDoc("a", "str", "An arg")
+
     def test_method_doc_render(self):
         """MethodDoc should render with params and returns."""
         method = MethodDoc(
@@ -122,6 +140,112 @@ class TestDocDataclasses:
         assert d["methods"][0]["params"][0]["name"] == "arg1"
         assert d["example"] == "test.method1('hello')"
 
+    def test_to_dict_and_json_are_cached(self):
+        """to_json_bytes() should be computed once and agree with to_dict()."""
+        docs = IntegrationDocs(name="test", description="Test integration.")
+        assert docs.to_dict() == docs.to_dict()
+        assert docs.to_json_bytes() is docs.to_json_bytes()
+        assert json.loads(docs.to_json_bytes()) == docs.to_dict()
+        assert docs.to_json() == docs.to_json_bytes().decode()
+
+    def test_to_dict_mutation_does_not_leak(self):
+        """Modifying a to_dict() result should not affect later dicts or JSON."""
+        docs = IntegrationDocs(
+            name="test",
+            description="Test integration.",
+            methods=[MethodDoc("m", "A method.", params=[ParamDoc("a", "str", "An arg")])],
+            init_params=[ParamDoc("token", "str", "Auth token")],
+        )
+        d = docs.to_dict()
+        d["name"] = "hacked"
+        d["methods"][0]["name"] = "hacked"
+        d["methods"][0]["params"][0]["name"] = "hacked"
+        d["init_params"].clear()
+
+        fresh = docs.to_dict()
+        assert fresh["name"] == "test"
+        assert fresh["methods"][0]["name"] == "m"
+        assert fresh["methods"][0]["params"][0]["name"] == "a"
+        assert len(fresh["init_params"]) == 1
+        assert "hacked" not in docs.to_json()
+
+    def test_to_json_bytes_without_orjson(self, monkeypatch):
+        """to_json_bytes() should fall back to the stdlib json module."""
+        from wren.integrations import docs as docs_module
+
+        monkeypatch.setattr(docs_module, "orjson", None)
+        docs = IntegrationDocs(name="test", description="Test integration.")
+        assert json.loads(docs.to_json_bytes()) == docs.to_dict()
+
+    def test_to_json_bytes_same_with_and_without_orjson(self, monkeypatch):
+        """Both serializers should emit identical UTF-8 bytes for non-ASCII docs."""
+        pytest.importorskip("orjson")
+        from wren.integrations import docs as docs_module
+
+        def build():
+            return IntegrationDocs(
+                name="test",
+                description="Réagir avec 👍 — café",
+                methods=[
+                    MethodDoc("react", "Add 👍", params=[ParamDoc("emoji", "str", "e.g. 🎉")])
+                ],
+                example="test.react('👍')",
+            )
+
+        with_orjson = build().to_json_bytes()
+        monkeypatch.setattr(docs_module, "orjson", None)
+        without_orjson = build().to_json_bytes()
+
+        assert with_orjson == without_orjson
+        assert "👍".encode() in without_orjson
+
+    def test_docs_are_frozen(self):
+        """Doc dataclasses should be immutable with tuple sequences."""
+        docs = IntegrationDocs(
+            name="test",
+            description="Test integration.",
+            methods=[MethodDoc("m", "A method.", params=[ParamDoc("a", "str", "An arg")])],
+        )
+        assert isinstance(docs.methods, tuple)
+        assert isinstance(docs.methods[0].params, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            docs.name = "other"
+
+    def test_method_names(self):
+        """method_names should list documented methods and be cached."""
+        docs = IntegrationDocs(
+            name="test",
+            description="Test integration.",
+            methods=[MethodDoc("a", "A method."), MethodDoc("b", "B method.")],
+        )
+        assert docs.method_names == {"a", "b"}
+        assert docs.method_names is docs.method_names
+
+    def test_render_markdown_is_cached(self):
+        """Repeated renders should return the same string object."""
+        docs = IntegrationDocs(
+            name="test",
+            description="Test integration.",
+            methods=[MethodDoc("m", "A method.")],
+        )
+        assert docs.render_markdown() is docs.render_markdown()
+
+    def test_lazy_docs_builds_once(self):
+        """LazyDocs should build the docs on first access and reuse them."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return IntegrationDocs(name="lazy", description="Lazy integration.")
+
+        class Holder:
+            DOCS = LazyDocs(build)
+
+        assert calls == []
+        assert Holder.DOCS is Holder().DOCS
+        assert Holder.DOCS.name == "lazy"
+        assert len(calls) == 1
+
     def test_render_all_docs(self):
         """render_all_docs should combine multiple integrations."""
         docs = [
@@ -153,6 +277,12 @@ class TestIntegrationRegistry:
         available = list_integrations()
         assert available == sorted(available)
 
+    def test_list_integrations_returns_copy(self):
+        """Mutating the returned list should not affect later calls."""
+        available = list_integrations()
+        available.append("bogus")
+        assert "bogus" not in list_integrations()
+
     def test_get_integration_docs_returns_docs(self):
         """get_integration_docs should return IntegrationDocs for known integration."""
         docs = get_integration_docs("gmail")
@@ -166,27 +296,35 @@ class TestIntegrationRegistry:
         assert docs is None
 
 
+@pytest.fixture(scope="module")
+def all_docs():
+    """Resolve every integration's docs once for the whole module."""
+    return {name: get_integration_docs(name) for name in list_integrations()}
+
+
 class TestAllIntegrationsHaveDocs:
     """Validate that all registered integrations have documentation."""
 
-    def test_all_integrations_have_docs(self):
+    def test_all_integrations_have_docs(self, all_docs):
         """Every registered integration should have DOCS defined."""
-        for name in list_integrations():
-            docs = get_integration_docs(name)
+        for name, docs in all_docs.items():
             assert docs is not None, f"Integration '{name}' is missing DOCS"
 
-    def test_all_docs_have_required_fields(self):
+    def test_all_docs_have_required_fields(self, all_docs):
         """All DOCS should have name, description, and example."""
-        for name in list_integrations():
-            docs = get_integration_docs(name)
+        for name, docs in all_docs.items():
             assert docs.name, f"Integration '{name}' DOCS missing name"
             assert docs.description, f"Integration '{name}' DOCS missing description"
             assert docs.example, f"Integration '{name}' DOCS missing example"
 
-    def test_all_docs_have_methods(self):
+    def test_docs_names_match_registration(self, all_docs):
+        """Each integration's DOCS should be named after its registered name."""
+        for name, docs in all_docs.items():
+            assert docs.name == name
+
+    def test_all_docs_have_methods(self, all_docs):
         """All DOCS should have at least one method documented."""
-        for name in list_integrations():
-            docs = get_integration_docs(name)
+        for name, docs in all_docs.items():
             assert len(docs.methods) > 0, f"Integration '{name}' DOCS has no methods"
 
 
@@ -201,6 +339,12 @@ class TestRenderIntegrationDocs:
         for name in list_integrations():
             assert f"### {name}" in rendered
 
+    def test_render_all_is_cached(self):
+        """Rendering all docs should reuse the same string."""
+        rendered = render_integration_docs()
+        assert rendered is render_integration_docs()
+        assert rendered is get_all_docs_markdown()
+
     def test_render_specific(self):
         """render_integration_docs(names) should render only specified."""
         rendered = render_integration_docs(["gmail", "slack"])
@@ -209,6 +353,21 @@ class TestRenderIntegrationDocs:
         # Should NOT include cron
         assert "### cron" not in rendered
 
+    def test_render_specific_is_cached(self):
+        """Rendering the same names again should reuse the same string, in order."""
+        rendered = render_integration_docs(["gmail", "slack"])
+        assert rendered is render_integration_docs(["gmail", "slack"])
+
+        reordered = render_integration_docs(["slack", "gmail"])
+        assert reordered.index("### slack") < reordered.index("### gmail")
+
+    def test_render_bytes(self):
+        """render_integration_docs_bytes should return the cached UTF-8 render."""
+        for names in (None, ["gmail", "slack"]):
+            encoded = render_integration_docs_bytes(names)
+            assert encoded == render_integration_docs(names).encode()
+            assert encoded is render_integration_docs_bytes(names)
+
     def test_render_produces_valid_markdown(self):
         """Rendered docs should be valid-looking markdown."""
         rendered = render_integration_docs()
@@ -251,7 +410,7 @@ class TestSpecificIntegrationDocs:
     def test_gmail_docs(self):
         """Gmail docs should have expected methods."""
         docs = get_integration_docs("gmail")
-        method_names = {m.name for m in docs.methods}
+        method_names = docs.method_names
         assert "inbox" in method_names
         assert "send_email" in method_names
         assert "search" in method_names
@@ -259,7 +418,7 @@ class TestSpecificIntegrationDocs:
     def test_slack_docs(self):
         """Slack docs should have expected methods."""
         docs = get_integration_docs("slack")
-        method_names = {m.name for m in docs.methods}
+        method_names = docs.method_names
         assert "post" in method_names
         assert "send_message" in method_names
         assert "get_messages" in method_names
@@ -267,14 +426,14 @@ class TestSpecificIntegrationDocs:
     def test_messaging_docs(self):
         """Messaging docs should have expected methods."""
         docs = get_integration_docs("messaging")
-        method_names = {m.name for m in docs.methods}
+        method_names = docs.method_names
         assert "post" in method_names
         assert "send_message" in method_names
 
     def test_cron_docs(self):
         """Cron docs should have expected methods."""
         docs = get_integration_docs("cron")
-        method_names = {m.name for m in docs.methods}
+        method_names = docs.method_names
         assert "schedule" in method_names
         assert "get_schedules" in method_names
 
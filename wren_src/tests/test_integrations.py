@@ -1,5 +1,8 @@
 """Tests for wren.integrations module."""
 
+import json
+import sys
+
 import pytest
 
 from wren.core.registry import registry
@@ -15,6 +18,13 @@ def clean_registry():
     registry.clear()
 
 
+@pytest.fixture
+def extraction_mode(clean_registry, monkeypatch):
+    """Record integrations at init() time, as during metadata extraction."""
+    monkeypatch.setattr(clean_registry, "extraction_mode", True)
+    return clean_registry
+
+
 class TestIntegrationManager:
     """Test IntegrationManager class."""
 
@@ -32,13 +42,21 @@ class TestIntegrationManager:
 class TestIntegrationInitializer:
     """Test IntegrationInitializer class."""
 
-    def test_init_registers_integration(self, clean_registry):
-        """init() should register integration in registry."""
+    def test_init_registers_integration(self, extraction_mode):
+        """init() should register integration in registry when extracting metadata."""
         integrations.cron.init()
 
-        metadata = clean_registry.get_metadata()
+        metadata = extraction_mode.get_metadata()
         assert "cron" in metadata["integrations"]
 
+    def test_init_defers_registration_until_connected(self, clean_registry):
+        """Outside extraction mode, init() should register on first connection."""
+        messaging = integrations.messaging.init()
+        assert clean_registry.get_metadata()["integrations"] == []
+
+        messaging.post("Hello")
+        assert clean_registry.get_metadata()["integrations"] == ["messaging"]
+
     def test_init_returns_integration_instance(self, clean_registry):
         """init() should return an integration instance."""
         cron = integrations.cron.init()
@@ -102,6 +120,25 @@ class TestCronIntegration:
         schedules = cron.get_schedules()
         assert len(schedules) >= 1
 
+    def test_get_schedules_excludes_other_triggers(self, clean_registry):
+        """get_schedules() should only return schedule triggers."""
+        cron = integrations.cron.init()
+
+        def nightly():
+            pass
+
+        clean_registry.register_trigger("email", {"filter": {}}, lambda: None)
+        cron.schedule("0 0 * * *", nightly)
+
+        schedules = cron.get_schedules()
+        assert schedules == [
+            {
+                "type": "schedule",
+                "func": "nightly",
+                "config": {"cron": "0 0 * * *", "timezone": None},
+            }
+        ]
+
 
 class TestMessagingIntegration:
     """Test MessagingIntegration class."""
@@ -134,6 +171,21 @@ class TestMessagingIntegration:
         assert result["message"]["text"] == "Hello"
         assert "ts" in result
 
+    def test_send_message_response_is_plain_dict(self, clean_registry):
+        """The response should be a plain, JSON-serializable API dict."""
+        messaging = integrations.messaging.init()
+        result = messaging.send_message("#test", "Hello")
+
+        expected = {
+            "ok": True,
+            "channel": "#test",
+            "ts": result["ts"],
+            "message": {"text": "Hello"},
+        }
+        assert type(result) is dict
+        assert result == expected
+        assert json.loads(json.dumps(result)) == expected
+
     def test_post_uses_default_channel(self, clean_registry):
         """post() should send to default channel."""
         messaging = integrations.messaging.init(default_channel="#alerts")
@@ -141,6 +193,30 @@ class TestMessagingIntegration:
 
         assert result["channel"] == "#alerts"
 
+    def test_post_batch(self, clean_registry):
+        """post_batch() should send every message to the default channel in order."""
+        messaging = integrations.messaging.init(default_channel="#alerts")
+        results = messaging.post_batch(["One", "Two"])
+
+        assert [r["message"]["text"] for r in results] == ["One", "Two"]
+        assert all(r["channel"] == "#alerts" for r in results)
+        assert [m.text for m in messaging.get_sent_messages()] == ["One", "Two"]
+
+    def test_timestamp_cache(self, clean_registry, monkeypatch):
+        """With the timestamp cache enabled, quick sends should share one timestamp."""
+        messaging_module = sys.modules["wren.integrations.messaging"]
+        monkeypatch.setattr(messaging_module, "_TIMESTAMP_CACHE", True)
+        monkeypatch.setattr(messaging_module, "_NOW_TTL", 60.0)
+        monkeypatch.setattr(messaging_module, "_now_cached", None)
+
+        messaging = integrations.messaging.init()
+        first = messaging.post("One")
+        second = messaging.post("Two")
+
+        assert first["ts"] == second["ts"]
+        sent = messaging.get_sent_messages()
+        assert sent[0].timestamp.isoformat() == first["ts"]
+
     def test_message_tracking(self, clean_registry):
         """Sent messages should be trackable."""
         messaging = integrations.messaging.init()
@@ -153,6 +229,52 @@ class TestMessagingIntegration:
         assert messages[0].text == "First"
         assert messages[1].channel == "#ch2"
 
+    def test_expected_messages_presizes_history(self, clean_registry):
+        """Pre-sized history should only report sent messages, even past the hint."""
+        messaging = integrations.messaging.init(expected_messages=2)
+        messaging.post("One")
+        assert [m.text for m in messaging.get_sent_messages()] == ["One"]
+
+        messaging.post_batch(["Two", "Three"])
+        messaging.post("Four")
+        assert [m.text for m in messaging.get_sent_messages()] == ["One", "Two", "Three", "Four"]
+
+        messaging.clear_messages()
+        assert messaging.get_sent_messages() == []
+
+    def test_iter_sent_messages(self, clean_registry):
+        """iter_sent_messages should yield the same messages as get_sent_messages."""
+        messaging = integrations.messaging.init()
+        messaging.send_message("#ch1", "First")
+        messaging.send_message("#ch2", "Second")
+
+        assert list(messaging.iter_sent_messages()) == messaging.get_sent_messages()
+
+    def test_iter_sent_messages_survives_clear(self, clean_registry):
+        """Clearing mid-iteration should not break an iterator already started."""
+        messaging = integrations.messaging.init()
+        messaging.send_message("#ch1", "First")
+        messaging.send_message("#ch2", "Second")
+
+        messages = messaging.iter_sent_messages()
+        assert next(messages).text == "First"
+        messaging.clear_messages()
+        messaging.send_message("#ch3", "Third")
+
+        assert [m.text for m in messages] == ["Second"]
+        assert [m.text for m in messaging.get_sent_messages()] == ["Third"]
+
+    def test_filter_by_channel(self, clean_registry):
+        """filter_by_channel should return only that channel's messages, in order."""
+        messaging = integrations.messaging.init()
+        messaging.send_message("#ch1", "First", priority="high")
+        messaging.send_message("#ch2", "Second")
+        messaging.send_message("#ch1", "Third")
+
+        messages = messaging._client.filter_by_channel("#ch1")
+        assert [m.text for m in messages] == ["First", "Third"]
+        assert messages[0].metadata == {"priority": "high"}
+
     def test_clear_messages(self, clean_registry):
         """clear_messages should reset message history."""
         messaging = integrations.messaging.init()
@@ -163,21 +285,48 @@ class TestMessagingIntegration:
         assert len(messages) == 0
 
 
+class TestStubIntegration:
+    """Test StubIntegration method proxies."""
+
+    def test_missing_method_raises(self, clean_registry):
+        """Calling an unimplemented method should raise NotImplementedError."""
+        slack = integrations.slack.init()
+        with pytest.raises(NotImplementedError, match="'post'"):
+            slack.post("Hello")
+
+    def test_missing_method_proxy_is_cached(self, clean_registry):
+        """Repeated lookups of the same name should return the same proxy."""
+        slack = integrations.slack.init()
+        assert slack.post is slack.post
+        assert slack.post is not slack.send_message
+
+
 class TestIntegrationUsagePattern:
     """Test the full usage pattern as documented."""
 
-    def test_module_level_init_pattern(self, clean_registry):
+    def test_module_level_init_pattern(self, extraction_mode):
         """Test the typical module-level initialization pattern."""
         # Simulating top of a user's script
         _cron = integrations.cron.init()  # noqa: F841
         _messaging = integrations.messaging.init(default_channel="#alerts")  # noqa: F841
 
         # Verify registrations happened
-        metadata = clean_registry.get_metadata()
+        metadata = extraction_mode.get_metadata()
         assert "cron" in metadata["integrations"]
         assert "messaging" in metadata["integrations"]
 
-    def test_full_workflow(self, clean_registry):
+    def test_import_script_records_init_calls(self, clean_registry, tmp_path):
+        """import_script() should record integrations at init() time."""
+        from wren.core.runtime import import_script
+
+        script = tmp_path / "script.py"
+        script.write_text("import wren\n\ncron = wren.integrations.cron.init()\n")
+        import_script(str(script))
+
+        assert clean_registry.get_metadata()["integrations"] == ["cron"]
+        assert not clean_registry.extraction_mode
+
+    def test_full_workflow(self, extraction_mode):
         """Test complete workflow: init, decorate, use."""
         import wren
 
@@ -107,6 +107,37 @@ class TestWrenRegistry:
         assert isinstance(metadata["integrations"], list)
         assert isinstance(metadata["triggers"], list)
 
+    def test_get_metadata_cached_until_registration(self, clean_registry):
+        """Metadata should be refreshed once something new is registered."""
+        clean_registry.register_integration("gmail")
+        metadata = clean_registry.get_metadata()
+        assert clean_registry.get_metadata() == metadata
+
+        clean_registry.register_integration("gmail")
+        assert clean_registry.get_metadata() == metadata
+
+        clean_registry.register_trigger("schedule", {"cron": "0 9 * * *"}, lambda: None)
+        updated = clean_registry.get_metadata()
+        assert updated != metadata
+        assert len(updated["triggers"]) == 1
+
+    def test_get_metadata_mutation_does_not_leak(self, clean_registry):
+        """Modifying a returned metadata dict should not affect later calls."""
+        clean_registry.register_integration("gmail")
+        clean_registry.register_trigger("schedule", {"cron": "0 9 * * *"}, lambda: None)
+        metadata = clean_registry.get_metadata()
+
+        metadata["integrations"].append("slack")
+        metadata["schedules"].clear()
+        metadata["triggers"][0]["type"] = "email"
+        metadata["extra"] = True
+
+        fresh = clean_registry.get_metadata()
+        assert fresh["integrations"] == ["gmail"]
+        assert len(fresh["schedules"]) == 1
+        assert fresh["triggers"][0]["type"] == "schedule"
+        assert "extra" not in fresh
+
     def test_get_functions(self, clean_registry):
         """get_functions should return callable mapping."""
 
@@ -125,6 +156,13 @@ class TestWrenRegistry:
         assert funcs["daily_job"]() == "daily"
         assert funcs["email_handler"]() == "email"
 
+    def test_get_functions_is_read_only(self, clean_registry):
+        """get_functions should not allow callers to modify the registry."""
+        clean_registry.register_trigger("schedule", {"cron": "0 9 * * *"}, lambda: None)
+
+        with pytest.raises(TypeError):
+            clean_registry.get_functions()["other"] = lambda: None
+
     def test_clear(self, clean_registry):
         """Clear should reset all registrations."""
         clean_registry.register_integration("test")
@@ -136,6 +174,8 @@ class TestWrenRegistry:
         metadata = clean_registry.get_metadata()
         assert metadata["integrations"] == []
         assert metadata["triggers"] == []
+        assert clean_registry.get_triggers_by_type("schedule") == []
+        assert dict(clean_registry.get_functions()) == {}
 
 
 class TestModuleLevelRegistry: